@@ -18,36 +18,571 @@ Features:
 
 import json
 import logging
+import logging.handlers
+import queue
+import re
+import sys
+import tempfile
+import threading
 import time
+import weakref
 import argparse
+import atexit
+import bisect
+import io
+import math
 import os
+from abc import ABC, abstractmethod
+from array import array
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
-from playwright.sync_api import sync_playwright, Page, Browser, BrowserContext
-from reportlab.lib.pagesizes import letter, A4
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, PageBreak
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.units import inch
-from reportlab.lib import colors
-from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT
-import matplotlib.pyplot as plt
-import matplotlib.dates as mdates
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+from playwright.sync_api import sync_playwright, Page, Browser, BrowserContext, Locator
+from playwright.sync_api import Error as PlaywrightError
+from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+from reportlab.lib.pagesizes import A4
 from datetime import datetime
-import pandas as pd
-import io
-from reportlab.lib.utils import ImageReader
-from reportlab.platypus import Image
+from functools import cached_property, lru_cache
+
+# The rest of ReportLab is imported inside the PDF methods, so runs that skip
+# the PDF report never load it
+if TYPE_CHECKING:
+    from reportlab.lib.styles import ParagraphStyle
+    from reportlab.platypus import TableStyle
+
+# Full table width on A4 with 50pt margins on each side
+PAGE_WIDTH = A4[0] - 100
+
+
+@lru_cache(maxsize=None)
+def _col_widths(*fractions: float) -> Tuple[float, ...]:
+    """Absolute column widths for a table layout given as fractions of PAGE_WIDTH"""
+    return tuple(PAGE_WIDTH * fraction for fraction in fractions)
+
+
+@lru_cache(maxsize=None)
+def _sample_styles():
+    """Default ReportLab styles, parents of the report's paragraph styles"""
+    from reportlab.lib.styles import getSampleStyleSheet
+    return getSampleStyleSheet()
+
+
+@lru_cache(maxsize=None)
+def _logo_bytes(path: str) -> bytes:
+    """Read a logo file once per process; each report wraps the bytes in a fresh buffer"""
+    return Path(path).read_bytes()
+
+
+@lru_cache(maxsize=None)
+def _hex_color(value: str):
+    """Parse a '#rrggbb' color once; the report reuses a small fixed palette"""
+    from reportlab.lib import colors
+    return colors.HexColor(value)
+
+
+@lru_cache(maxsize=None)
+def _make_header_table_style(header_color: str, body_color: str, grid_color: str) -> 'TableStyle':
+    """Table style with a bold colored header row, shared by every table using the same palette"""
+    from reportlab.lib import colors
+    from reportlab.platypus import TableStyle
+    return TableStyle([
+        ('BACKGROUND', (0, 0), (-1, 0), _hex_color(header_color)),
+        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+        ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
+        ('FONTSIZE', (0, 0), (-1, 0), 12),
+        ('FONTSIZE', (0, 1), (-1, -1), 10),
+        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+        ('BACKGROUND', (0, 1), (-1, -1), _hex_color(body_color)),
+        ('GRID', (0, 0), (-1, -1), 1, _hex_color(grid_color)),
+        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+    ])
+
+
+@lru_cache(maxsize=None)
+def _fixed_table_styles() -> Dict[str, 'TableStyle']:
+    """One-off table styles of the PDF report, built once per process"""
+    from reportlab.lib import colors
+    from reportlab.platypus import TableStyle
+    return {
+        # Centered logo banner on the title page
+        'logo_header': TableStyle([
+            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+            ('LEFTPADDING', (0, 0), (-1, -1), 0),
+            ('RIGHTPADDING', (0, 0), (-1, -1), 0),
+            ('TOPPADDING', (0, 0), (-1, -1), 0),
+            ('BOTTOMPADDING', (0, 0), (-1, -1), 0),
+        ]),
+        # Title page metrics grid
+        'title_metrics': TableStyle([
+            ('BACKGROUND', (0, 0), (-1, 0), _hex_color('#1a365d')),  # Dark blue header
+            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+            ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
+            ('FONTSIZE', (0, 0), (-1, 0), 11),
+            ('FONTSIZE', (0, 1), (-1, -1), 10),
+            ('BOTTOMPADDING', (0, 0), (-1, 0), 10),
+            ('TOPPADDING', (0, 0), (-1, 0), 8),
+            ('BOTTOMPADDING', (0, 1), (-1, -1), 6),
+            ('TOPPADDING', (0, 1), (-1, -1), 6),
+            ('LEFTPADDING', (0, 0), (-1, -1), 8),
+            ('RIGHTPADDING', (0, 0), (-1, -1), 8),
+            ('BACKGROUND', (0, 1), (-1, -1), _hex_color('#f7fafc')),
+            ('GRID', (0, 0), (-1, -1), 1, _hex_color('#e2e8f0')),
+            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+        ]),
+        # Highlighted box around a JavaScript error example
+        'error_box': TableStyle([
+            ('BACKGROUND', (0, 0), (-1, -1), _hex_color('#fed7d7')),
+            ('TEXTCOLOR', (0, 0), (-1, -1), _hex_color('#742a2a')),
+            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+            ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
+            ('FONTSIZE', (0, 0), (-1, -1), 9),
+            ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
+            ('TOPPADDING', (0, 0), (-1, -1), 8),
+            ('LEFTPADDING', (0, 0), (-1, -1), 10),
+            ('RIGHTPADDING', (0, 0), (-1, -1), 10),
+            ('GRID', (0, 0), (-1, -1), 1, _hex_color('#feb2b2')),
+            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+        ]),
+    }
+
+
+try:
+    import orjson
+except ImportError:  # Optional; the stdlib json module is used instead
+    orjson = None
+
+
+# Performance probes installed on every page load. Navigation/paint timings are
+# fixed once the page has loaded, so they are fetched once per run via
+# __btPerfStatic; each step only pulls the small memory snapshot from __btPerfLive.
+PERFORMANCE_INIT_SCRIPT = """
+    window.__btPerfStatic = () => {
+        const performance = window.performance;
+        const navigation = performance.getEntriesByType('navigation')[0] || {};
+        const paint = performance.getEntriesByType('paint');
+        return {
+            load_time: navigation.loadEventEnd - navigation.loadEventStart || 0,
+            dom_content_loaded: navigation.domContentLoadedEventEnd - navigation.domContentLoadedEventStart || 0,
+            first_paint: paint.find(entry => entry.name === 'first-paint')?.startTime || 0,
+            first_contentful_paint: paint.find(entry => entry.name === 'first-contentful-paint')?.startTime || 0
+        };
+    };
+    window.__btPerfLive = () => {
+        const memory = window.performance.memory || {};
+        return {
+            used: memory.usedJSHeapSize || 0,
+            total: memory.totalJSHeapSize || 0,
+            limit: memory.jsHeapSizeLimit || 0,
+            now: window.performance.now(),
+            timestamp: Date.now()
+        };
+    };
+"""
+
+# Full debug state of an element, gathered in a single evaluate round trip
+ELEMENT_STATE_SCRIPT = """
+    el => {
+        const style = window.getComputedStyle(el);
+        const rect = el.getBoundingClientRect();
+        return {
+            visible: rect.width > 0 && rect.height > 0 && style.visibility !== 'hidden',
+            enabled: !el.disabled,
+            classes: Array.from(el.classList),
+            text: (el.textContent || '').slice(0, 100) || 'No text',
+            tag_name: el.tagName,
+            attributes: Object.fromEntries(Array.from(el.attributes).map(attr => [attr.name, attr.value]))
+        };
+    }
+"""
+
+def _compile_keyword_pattern(categories):
+    """Compile (category, keywords) pairs into one multi-pattern matcher.
+    
+    Each alternative is wrapped in a lookahead so overlapping keywords from
+    different categories are all reported in a single scan of the text.
+    """
+    alternatives = '|'.join(
+        f"(?P<{category}>{'|'.join(re.escape(keyword) for keyword in keywords)})"
+        for category, keywords in categories
+    )
+    return re.compile(f"(?=(?:{alternatives}))")
+
+
+def _match_keyword_categories(pattern, text, stop_category):
+    """Return the set of keyword categories found in text, stopping early at stop_category"""
+    found = set()
+    for match in pattern.finditer(text):
+        found.add(match.lastgroup)
+        if match.lastgroup == stop_category:
+            break
+    return found
+
+
+def _json_line(record: Dict) -> bytes:
+    """Serialize a record as one UTF-8 JSON line"""
+    if orjson is not None:
+        return orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(record) + '\n').encode('utf-8')
+
+
+def _json_bytes(value, indent: bool = False) -> bytes:
+    """Serialize a value as UTF-8 JSON, compact unless indent is set
+    
+    Captured data is stored as primitives (floats for timestamps, plain
+    str/int/dict/list otherwise), so no default= fallback is needed.
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(value, option=option)
+    if indent:
+        return json.dumps(value, indent=2).encode('utf-8')
+    return json.dumps(value, separators=(',', ':')).encode('utf-8')
+
+
+def _json_loads(data):
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
+# Selector builders keyed by step selector_type
+SELECTOR_FORMATTERS = {
+    'text': lambda value, step: f"{step.get('base', 'button')}:has-text('{value}')",
+    'testid': lambda value, step: f'[data-testid="{value}"]',
+    'composite': lambda value, step: value,
+    'section_product': lambda value, step: f'[data-testid="section-product"].zv-product-{value}',
+}
+
+
+def _resolve_selector(step: Dict) -> Optional[str]:
+    """Build the selector string for a step based on selector type and value"""
+    formatter = SELECTOR_FORMATTERS.get(step['selector_type'])
+    return formatter(step['selector_value'], step) if formatter is not None else None
+
+
+# Relevance keywords (already lowercase), listed in priority order
+ZOOVU_DOMAINS = ('zoovu.com', 'barracuda-cdn.zoovu.com', 'orca-exd-global-components.zoovu.com', 'zoovu-components-library.zoovu.com')
+CONSOLE_KEYWORDS = (
+    ('zoovu_error', ZOOVU_DOMAINS),
+    ('pdf_generation', ('canvas', 'webgl', 'memory', 'heap', 'allocation', 'blob', 'pdf')),
+    ('configurator_error', ('configurator', 'product', 'summary', 'parameters', 'uselazyloading')),
+    ('image_loading', ('failed to load resource', 'image', 'screenshot', 'render')),
+    ('js_error', ('typeerror', 'referenceerror', 'out of memory', 'memory pressure')),
+)
+NETWORK_KEYWORDS = (
+    ('zoovu_request', ZOOVU_DOMAINS),
+    ('pdf_generation', ('pdf', 'canvas', 'blob', 'screenshot', 'render', 'export')),
+    ('image_loading', ('image', 'asset', 'static', 'media')),
+    ('lead_generation', ('email', 'lead', 'form', 'submit', 'contact')),
+)
+
+# Relevance categories reported for each event kind (js_error only marks a log as relevant)
+_CONSOLE_RELEVANCE_ORDER = tuple(category for category, _ in CONSOLE_KEYWORDS if category != 'js_error')
+_NETWORK_RELEVANCE_ORDER = tuple(category for category, _ in NETWORK_KEYWORDS)
+
+_CONSOLE_KEYWORD_RE = _compile_keyword_pattern(CONSOLE_KEYWORDS)
+_NETWORK_KEYWORD_RE = _compile_keyword_pattern(NETWORK_KEYWORDS)
+
+# Third-party hosts (analytics, ads, tracking) that play no part in the
+# configurator or PDF export; Chromium refuses requests to them before they go
+# out. Blocking is done with Network.setBlockedURLs rather than page.route,
+# because enabling request interception disables the page's HTTP cache.
+BLOCKED_REQUEST_DOMAINS = ('google-analytics', 'googletagmanager', 'doubleclick', 'facebook.net', 'hotjar', 'segment.io')
+BLOCKED_URL_PATTERNS = tuple(f"*{domain}*" for domain in BLOCKED_REQUEST_DOMAINS)
+BLOCKED_REQUEST_RE = re.compile('|'.join(map(re.escape, BLOCKED_REQUEST_DOMAINS)), re.IGNORECASE)
+
+# Resource types whose successful requests/responses are dropped at the listener.
+# Fonts, stylesheets and media play no part in the PDF export; images are kept
+# because failed image loads are one of the tracked categories.
+IGNORED_RESOURCE_TYPES = frozenset({'font', 'stylesheet', 'media'})
+
+# Network event kinds, stored as their index in NetworkBuffer.event
+NETWORK_EVENTS = ('request', 'response', 'failed')
+
+# Memory usage risk bands: a reading is LOW below 60%, MEDIUM below 80%, HIGH otherwise.
+# The overall pressure risk uses the peak: LOW up to 70%, MEDIUM up to 85%, HIGH above.
+RISK_LABELS = ('LOW', 'MEDIUM', 'HIGH')
+MEMORY_RISK_THRESHOLDS = (60, 80)
+PRESSURE_RISK_THRESHOLDS = (70, 85)
+
+
+def _memory_risk(memory_usage_percent: float) -> str:
+    return RISK_LABELS[bisect.bisect_right(MEMORY_RISK_THRESHOLDS, memory_usage_percent)]
+
+
+def _pressure_risk(peak_memory_usage: float) -> str:
+    return RISK_LABELS[bisect.bisect_left(PRESSURE_RISK_THRESHOLDS, peak_memory_usage)]
+
+
+@dataclass
+class PerfBuffer:
+    """Columnar storage for captured performance metrics (one array per field)"""
+    run_number: array = field(default_factory=lambda: array('i'))
+    timestamp: array = field(default_factory=lambda: array('d'))
+    mem_used: array = field(default_factory=lambda: array('q'))
+    mem_total: array = field(default_factory=lambda: array('q'))
+    mem_limit: array = field(default_factory=lambda: array('q'))
+    mem_pct: array = field(default_factory=lambda: array('d'))
+    perf_now: array = field(default_factory=lambda: array('d'))
+    step_name: List[Optional[str]] = field(default_factory=list)
+    navigation: Dict[int, Dict] = field(default_factory=dict)  # Navigation/paint timings per run
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def append(self, run_number: int, step_name: Optional[str], timestamp: float,
+               used: int, total: int, limit: int, pct: float, now: float):
+        with self._lock:
+            self.run_number.append(run_number)
+            self.step_name.append(step_name)
+            self.timestamp.append(timestamp)
+            self.mem_used.append(used)
+            self.mem_total.append(total)
+            self.mem_limit.append(limit)
+            self.mem_pct.append(pct)
+            self.perf_now.append(now)
+
+    def __len__(self):
+        return len(self.run_number)
+
+    def __iter__(self):
+        """Yield each metric as a dict in the exported record layout"""
+        for i in range(len(self)):
+            run_number = self.run_number[i]
+            yield {
+                'timestamp': self.timestamp[i],
+                'memory': {
+                    'used': self.mem_used[i],
+                    'total': self.mem_total[i],
+                    'limit': self.mem_limit[i]
+                },
+                'navigation': self.navigation.get(run_number, {}),
+                'timing': {
+                    'now': self.perf_now[i]
+                },
+                'run_number': run_number,
+                'step_name': self.step_name[i],
+                'memory_usage_percent': self.mem_pct[i]
+            }
+
+
+@dataclass
+class SpillingBuffer(ABC):
+    """Base for event buffers that keep at most max_rows in memory.
+    
+    Once full, the in-memory rows are appended as JSON lines to a temporary
+    file named after spill_prefix and the columns are cleared; iteration
+    replays the spill file before the rows still held in memory. Summary
+    counts are kept in counts as rows arrive so they stay exact after a spill.
+    """
+    epoch_offset: float = 0.0  # Wall clock minus monotonic clock, in seconds
+    spill_prefix: Optional[str] = None  # Spilling is disabled when unset
+    spill_path: Optional[str] = None  # Created in the temp directory on the first spill
+    max_rows: int = 10000
+    spilled: int = 0
+    counts: Counter = field(default_factory=Counter)
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    @abstractmethod
+    def _row_count(self) -> int:
+        """Number of rows currently held in memory"""
+
+    @abstractmethod
+    def _records(self):
+        """Yield the in-memory rows as dicts in the exported record layout"""
+
+    @abstractmethod
+    def _clear(self):
+        """Drop the in-memory rows after they have been spilled"""
+
+    def _maybe_spill(self):
+        rows = self._row_count()
+        if self.spill_prefix is None or rows < self.max_rows:
+            return
+        if self.spill_path is None:
+            fd, self.spill_path = tempfile.mkstemp(prefix=f"{self.spill_prefix}_", suffix='.jsonl')
+            spill_file = os.fdopen(fd, 'wb')
+        else:
+            spill_file = open(self.spill_path, 'ab')
+        with spill_file:
+            spill_file.writelines(_json_line(record) for record in self._records())
+        self.spilled += rows
+        self._clear()
+
+    def discard_spill(self):
+        """Delete the spill file once its rows have been exported
+        
+        Counts and len() are unchanged, but iteration no longer replays the
+        spilled rows.
+        """
+        if self.spill_path is not None:
+            os.remove(self.spill_path)
+            self.spill_path = None
+
+    def tally(self) -> Tuple[Counter, Counter]:
+        """Totals by level/event and by relevance, in one pass over counts"""
+        kinds, relevances = Counter(), Counter()
+        for (kind, relevance), count in self.counts.items():
+            kinds[kind] += count
+            relevances[relevance] += count
+        return kinds, relevances
+
+    def __len__(self):
+        return self.spilled + self._row_count()
+
+    def __iter__(self):
+        """Yield each row as a dict in the exported record layout"""
+        if self.spill_path is not None:
+            with open(self.spill_path, 'rb') as f:
+                for line in f:
+                    yield _json_loads(line)
+        yield from self._records()
+
+
+@dataclass
+class ConsoleBuffer(SpillingBuffer):
+    """Columnar storage for captured console logs, counted by (level, relevance)"""
+    timestamp: array = field(default_factory=lambda: array('q'))  # Monotonic nanoseconds
+    type: List[str] = field(default_factory=list)
+    text: List[str] = field(default_factory=list)
+    level: List[str] = field(default_factory=list)
+    relevance: List[str] = field(default_factory=list)
+    zoovu_error_examples: List[str] = field(default_factory=list)  # First few Zoovu error texts, for the report
+
+    def append(self, timestamp: int, msg_type: str, text: str, level: str, relevance: str):
+        with self._lock:
+            self.timestamp.append(timestamp)
+            self.type.append(sys.intern(msg_type))
+            self.text.append(text)
+            self.level.append(level)
+            self.relevance.append(relevance)
+            self.counts[level, relevance] += 1
+            if level == 'error' and relevance == 'zoovu_error' and len(self.zoovu_error_examples) < 2:
+                self.zoovu_error_examples.append(text)
+            self._maybe_spill()
+
+    def _row_count(self) -> int:
+        return len(self.timestamp)
+
+    def _clear(self):
+        self.timestamp = array('q')
+        self.type, self.text, self.level, self.relevance = [], [], [], []
+
+    def _records(self):
+        for i in range(len(self.timestamp)):
+            yield {
+                'timestamp': self.timestamp[i] / 1e9 + self.epoch_offset,
+                'type': self.type[i],
+                'text': self.text[i],
+                'level': self.level[i],
+                'relevance': self.relevance[i]
+            }
+
+
+@dataclass
+class NetworkBuffer(SpillingBuffer):
+    """Columnar storage for captured network requests, responses and failures, counted by (event, relevance)"""
+    timestamp: array = field(default_factory=lambda: array('q'))  # Monotonic nanoseconds
+    event: array = field(default_factory=lambda: array('b'))  # Index into NETWORK_EVENTS
+    status: array = field(default_factory=lambda: array('h'))  # 0 for non-response events
+    url: List[str] = field(default_factory=list)
+    relevance: List[str] = field(default_factory=list)
+    method: List[Optional[str]] = field(default_factory=list)
+    resource_type: List[Optional[str]] = field(default_factory=list)
+    status_text: List[Optional[str]] = field(default_factory=list)
+    failure_text: List[Optional[str]] = field(default_factory=list)
+    error_responses: int = 0
+
+    def append(self, timestamp: int, event: str, url: str, relevance: str, status: int = 0,
+               method: str = None, resource_type: str = None, status_text: str = None, failure_text: str = None):
+        with self._lock:
+            self.timestamp.append(timestamp)
+            self.event.append(NETWORK_EVENTS.index(event))
+            self.status.append(status)
+            self.url.append(url)
+            self.relevance.append(relevance)
+            # Small vocabularies from the driver: keep one shared copy of each string
+            self.method.append(sys.intern(method) if method else method)
+            self.resource_type.append(sys.intern(resource_type) if resource_type else resource_type)
+            self.status_text.append(sys.intern(status_text) if status_text else status_text)
+            self.failure_text.append(failure_text)
+            self.counts[event, relevance] += 1
+            if event == 'response' and status >= 400:
+                self.error_responses += 1
+            self._maybe_spill()
+
+    def count_event(self, event: str) -> int:
+        return sum(count for (kind, _), count in self.counts.items() if kind == event)
+
+    def count_error_responses(self) -> int:
+        return self.error_responses
+
+    def _row_count(self) -> int:
+        return len(self.timestamp)
+
+    def _clear(self):
+        self.timestamp, self.event, self.status = array('q'), array('b'), array('h')
+        self.url, self.relevance, self.method = [], [], []
+        self.resource_type, self.status_text, self.failure_text = [], [], []
+
+    def _records(self):
+        for i in range(len(self.timestamp)):
+            event = NETWORK_EVENTS[self.event[i]]
+            timestamp = self.timestamp[i] / 1e9 + self.epoch_offset
+            entry = {'timestamp': timestamp, 'event': event, 'url': self.url[i]}
+            if event == 'request':
+                entry['method'] = self.method[i]
+                entry['resource_type'] = self.resource_type[i]
+            elif event == 'response':
+                entry['status'] = self.status[i]
+                entry['status_text'] = self.status_text[i]
+                entry['response_time'] = timestamp
+            else:
+                entry['failure_text'] = self.failure_text[i]
+            entry['relevance'] = self.relevance[i]
+            yield entry
+
+
+class FlowableStream(list):
+    """Flowable list for doc.build() that refills itself one section at a time.
+    
+    ReportLab consumes flowables from the front of the list; whenever it runs
+    dry the next section is materialized, so only the section being laid out
+    is held in memory.
+    """
+
+    def __init__(self, sections):
+        super().__init__()
+        self._sections = iter(sections)
+
+    def __len__(self):
+        while not super().__len__():
+            section = next(self._sections, None)
+            if section is None:
+                break
+            self.extend(section)
+        return super().__len__()
 
 
 class BostonTecStressTest:
-    def __init__(self, test_path_file: str, iterations: int = 5, headless: bool = False):
+    def __init__(self, test_path_file: str, iterations: int = 5, headless: bool = False, generate_pdf: bool = True):
         self.test_path_file = test_path_file
         self.iterations = iterations
         self.headless = headless
         self.target_url = "https://www.bostontec.com/3d-workbench-builder/?"
-        self.generate_pdf = True  # Default to generating PDF reports
+        self.generate_pdf = generate_pdf  # PDF sections are only built when this is set
         self.generate_html = False  # HTML reports are optional
         self.deploy_reports = False  # GitHub Pages deployment is optional
+        self.debug_elements = False  # Element state capture around clicks is opt-in
+        self.interactive = not headless  # Wait for Enter before closing the browser
+        self.inspect_seconds = 0  # Timed inspection window instead of waiting for Enter
+        self.workers = 1  # Concurrent browsers; runs are distributed round-robin
+        self.cdp_endpoint: Optional[str] = None  # Attach to a running Chromium over CDP instead of launching one
+        self.ignored_resource_types = IGNORED_RESOURCE_TYPES  # Empty to capture every network event
+        self.capture_screenshots = True  # Viewport JPEG of the final state after each run
         
         # Setup logging
         self.setup_logging()
@@ -55,32 +590,113 @@ class BostonTecStressTest:
         # Load test path
         self.test_steps = self.load_test_path()
         
+        # Event timestamps use the monotonic clock and are converted to wall clock at report time
+        self._now_ns = time.monotonic_ns
+        self._epoch_offset = time.time() - time.monotonic()
+        
         # Statistics
         self.stats = {
             'total_runs': 0,
             'successful_runs': 0,
             'failed_runs': 0,
             'step_failures': {},
-            'run_times': [],
-            'console_logs': [],
-            'network_requests': [],
-            'performance_metrics': [],
+            'run_times': array('d'),
+            'console_logs': ConsoleBuffer(epoch_offset=self._epoch_offset, spill_prefix='console_logs'),
+            'network_requests': NetworkBuffer(epoch_offset=self._epoch_offset, spill_prefix='network_requests'),
+            'performance_metrics': PerfBuffer(),
             'memory_metrics': [],
-            'performance_degradation': []
+            'performance_degradation': [],
+            # Running aggregates, updated by _record_run_time / _record_memory
+            '_agg': {
+                'run_time_sum': 0.0,
+                'run_time_min': None,
+                'run_time_max': None,
+                'memory_peak': None,
+                'memory_sum': 0.0,
+                'memory_count': 0,
+                'elevated_memory_count': 0,
+                'high_memory_count': 0,
+                'critical_memory_count': 0
+            }
         }
+        
+        # Running per-run memory aggregates, updated as metrics are captured
+        self._run_mem_sum: Dict[int, float] = defaultdict(float)
+        self._run_mem_n: Dict[int, int] = defaultdict(int)
+        self._run_mem_peak: Dict[int, float] = {}
+        self._run_mem_high: Dict[int, int] = defaultdict(int)
+        self._first_mem_pct: Dict[int, float] = {}
+        self._last_mem_pct: Dict[int, float] = {}
+        
+        # (measurement count, result) of the last _analyze_memory_patterns call
+        self._memory_analysis_cache: Optional[Tuple[int, Dict]] = None
+        
+        # Guards the run counters when several workers record results
+        self._stats_lock = threading.Lock()
+        
+        # Background writer for screenshots so disk I/O overlaps the next iteration;
+        # created per run_stress_test call and drained when its runs finish
+        self._io_pool: Optional[ThreadPoolExecutor] = None
+        
+        # Per page, the URL whose DOM is known to be loaded; lets steps skip the readiness wait
+        self._dom_ready_url: "weakref.WeakKeyDictionary[Page, str]" = weakref.WeakKeyDictionary()
 
     def setup_logging(self):
-        """Configure comprehensive logging"""
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler('bostontec_stress_test.log'),
-                logging.StreamHandler()
-            ]
-        )
+        """Configure comprehensive logging
+        
+        Records are queued by the calling thread and written by a background
+        listener; file output is batched through a MemoryHandler. The listener
+        is stopped at interpreter exit if shutdown_logging was not called.
+        """
+        formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+        
+        # Thread and process fields are not in the format; skip collecting them per record
+        logging.logThreads = logging.logProcesses = logging.logMultiprocessing = False
+        
+        self._log_file_target = logging.FileHandler('bostontec_stress_test.log', encoding='utf-8')
+        self._log_file_target.setFormatter(formatter)
+        self._log_file_handler = logging.handlers.MemoryHandler(capacity=1024, target=self._log_file_target)
+        
+        stream_handler = logging.StreamHandler()
+        stream_handler.setFormatter(formatter)
+        
+        log_queue = queue.Queue(-1)
+        root_logger = logging.getLogger()
+        root_logger.setLevel(logging.INFO)
+        self._log_queue_handler = logging.handlers.QueueHandler(log_queue)
+        root_logger.addHandler(self._log_queue_handler)
+        
+        self._log_listener = logging.handlers.QueueListener(log_queue, self._log_file_handler, stream_handler)
+        self._log_listener.start()
+        atexit.register(self.shutdown_logging)
         self.logger = logging.getLogger(__name__)
 
+    def shutdown_logging(self):
+        """Drain queued log records, flush buffered file output and close the log file
+        
+        Safe to call more than once.
+        """
+        if self._log_listener is None:
+            return
+        logging.getLogger().removeHandler(self._log_queue_handler)
+        self._log_listener.stop()
+        self._log_listener = None
+        self._log_file_handler.close()  # Flushes the buffer but leaves its target open
+        self._log_file_target.close()
+
+    def block_third_party_requests(self, context: BrowserContext, page: Page):
+        """Have Chromium refuse requests to the blocked analytics/tracking hosts
+        
+        Done over a DevTools session so the page keeps its HTTP cache; blocked
+        requests surface as failed requests and are filtered out on capture.
+        """
+        try:
+            cdp_session = context.new_cdp_session(page)
+            cdp_session.send('Network.enable')
+            cdp_session.send('Network.setBlockedURLs', {'urls': list(BLOCKED_URL_PATTERNS)})
+        except PlaywrightError as e:
+            self.logger.warning(f"Could not block third-party requests: {e}")
+
     def setup_page_listeners(self, page: Page):
         """Setup comprehensive page event listeners"""
         # Console log listener
@@ -97,96 +713,70 @@ class BostonTecStressTest:
     def capture_console_log(self, msg):
         """Capture console logs from the page with smart filtering"""
         # Smart filtering - only capture relevant logs
-        if not self._is_relevant_console_log(msg):
+        is_relevant, relevance = self._classify_console_log(msg)
+        if not is_relevant:
             return
         
-        log_entry = {
-            'timestamp': time.time(),
-            'type': msg.type,
-            'text': msg.text,
-            'level': 'info',
-            'relevance': self._get_console_log_relevance(msg)
-        }
+        level = 'info'
         
         # Categorize console messages
         if msg.type == 'error':
-            log_entry['level'] = 'error'
-            self.logger.error(f"🚨 RELEVANT Console Error: {msg.text}")
+            level = 'error'
+            self.logger.error("🚨 RELEVANT Console Error: %s", msg.text)
         elif msg.type == 'warning':
-            log_entry['level'] = 'warning'
-            self.logger.warning(f"⚠️  RELEVANT Console Warning: {msg.text}")
+            level = 'warning'
+            self.logger.warning("⚠️  RELEVANT Console Warning: %s", msg.text)
         elif msg.type == 'log':
-            self.logger.info(f"📝 RELEVANT Console Log: {msg.text}")
+            self.logger.info("📝 RELEVANT Console Log: %s", msg.text)
         
-        self.stats['console_logs'].append(log_entry)
+        self.stats['console_logs'].append(self._now_ns(), msg.type, msg.text, level, relevance)
 
-    def _is_relevant_console_log(self, msg):
-        """Determine if a console log is relevant for PDF bug investigation"""
-        text = msg.text.lower()
+    def _classify_console_log(self, msg):
+        """Determine relevance and category of a console log in a single pass over its text"""
+        found = _match_keyword_categories(_CONSOLE_KEYWORD_RE, msg.text.lower(), 'zoovu_error')
         
-        # Zoovu-specific errors (high priority)
-        if any(domain in text for domain in ['zoovu.com', 'barracuda-cdn.zoovu.com', 'orca-exd-global-components.zoovu.com', 'zoovu-components-library.zoovu.com']):
-            return True
-        
-        # Canvas/WebGL memory errors
-        if any(keyword in text for keyword in ['canvas', 'webgl', 'memory', 'heap', 'allocation', 'blob', 'pdf']):
-            return True
+        # Highest-priority category wins: zoovu > pdf_generation > configurator_error > image_loading
+        for category in _CONSOLE_RELEVANCE_ORDER:
+            if category in found:
+                return True, category
         
         # JavaScript errors that could affect PDF generation
-        if msg.type == 'error' and any(keyword in text for keyword in ['typeerror', 'referenceerror', 'out of memory', 'memory pressure']):
-            return True
-        
-        # Configurator-specific errors
-        if any(keyword in text for keyword in ['configurator', 'product', 'summary', 'parameters', 'uselazyloading']):
-            return True
+        if msg.type == 'error' and 'js_error' in found:
+            return True, 'other'
         
-        # Image loading failures that could cause missing images in PDFs
-        if any(keyword in text for keyword in ['failed to load resource', 'image', 'screenshot', 'render']):
-            return True
-        
-        return False
-
-    def _get_console_log_relevance(self, msg):
-        """Get the relevance category for a console log"""
-        text = msg.text.lower()
-        
-        if any(domain in text for domain in ['zoovu.com', 'barracuda-cdn.zoovu.com', 'orca-exd-global-components.zoovu.com', 'zoovu-components-library.zoovu.com']):
-            return 'zoovu_error'
-        elif any(keyword in text for keyword in ['canvas', 'webgl', 'memory', 'heap', 'allocation', 'blob', 'pdf']):
-            return 'pdf_generation'
-        elif any(keyword in text for keyword in ['configurator', 'product', 'summary', 'parameters', 'uselazyloading']):
-            return 'configurator_error'
-        elif any(keyword in text for keyword in ['failed to load resource', 'image', 'screenshot', 'render']):
-            return 'image_loading'
-        else:
-            return 'other'
+        return False, 'other'
 
     def capture_network_request(self, request_or_response, event_type):
         """Capture network requests and responses with smart filtering"""
         try:
+            # Requests we blocked ourselves are not failures
+            if event_type == "failed" and BLOCKED_REQUEST_RE.search(request_or_response.url):
+                return
+            
+            # Skip asset traffic before classifying it; failures are always kept
+            if self.ignored_resource_types and event_type != "failed":
+                request = request_or_response.request if event_type == "response" else request_or_response
+                if request.resource_type in self.ignored_resource_types:
+                    return
+            
             # Smart filtering - only capture relevant network requests
-            if not self._is_relevant_network_request(request_or_response, event_type):
+            is_relevant, relevance = self._classify_network_request(request_or_response, event_type)
+            if not is_relevant:
                 return
             
+            network_requests = self.stats['network_requests']
             if event_type == "request":
-                log_entry = {
-                    'timestamp': time.time(),
-                    'event': 'request',
-                    'url': request_or_response.url,
-                    'method': request_or_response.method if hasattr(request_or_response, 'method') else 'N/A',
-                    'resource_type': request_or_response.resource_type if hasattr(request_or_response, 'resource_type') else 'N/A',
-                    'relevance': self._get_network_request_relevance(request_or_response.url)
-                }
+                network_requests.append(
+                    self._now_ns(), 'request', request_or_response.url, relevance,
+                    method=request_or_response.method if hasattr(request_or_response, 'method') else 'N/A',
+                    resource_type=request_or_response.resource_type if hasattr(request_or_response, 'resource_type') else 'N/A'
+                )
             elif event_type == "response":
-                log_entry = {
-                    'timestamp': time.time(),
-                    'event': 'response',
-                    'url': request_or_response.url,
-                    'status': request_or_response.status,
-                    'status_text': request_or_response.status_text,
-                    'response_time': time.time(),
-                    'relevance': self._get_network_request_relevance(request_or_response.url)
-                }
+                network_requests.append(
+                    self._now_ns(), 'response', request_or_response.url, relevance,
+                    status=request_or_response.status,
+                    status_text=request_or_response.status_text
+                )
             elif event_type == "failed":
                 # Handle failed requests safely
                 failure_text = 'Unknown failure'
@@ -199,142 +789,154 @@ class BostonTecStressTest:
                 except:
                     failure_text = 'Unknown failure'
                     
-                log_entry = {
-                    'timestamp': time.time(),
-                    'event': 'failed',
-                    'url': request_or_response.url,
-                    'failure_text': failure_text,
-                    'relevance': self._get_network_request_relevance(request_or_response.url)
-                }
-            
-            self.stats['network_requests'].append(log_entry)
+                network_requests.append(
+                    self._now_ns(), 'failed', request_or_response.url, relevance,
+                    failure_text=failure_text
+                )
             
             # Log important network events with relevance indicators
             if event_type == "failed":
-                self.logger.error(f"🚨 RELEVANT Network Request Failed: {request_or_response.url}")
+                self.logger.error("🚨 RELEVANT Network Request Failed: %s", request_or_response.url)
             elif event_type == "response" and request_or_response.status >= 400:
-                self.logger.warning(f"⚠️  RELEVANT Network Response Error: {request_or_response.status} - {request_or_response.url}")
+                self.logger.warning("⚠️  RELEVANT Network Response Error: %s - %s", request_or_response.status, request_or_response.url)
                 
         except Exception as e:
             # Don't let network logging break the main test
-            self.logger.warning(f"Error capturing network request: {e}")
+            self.logger.warning("Error capturing network request: %s", e)
 
-    def _is_relevant_network_request(self, request_or_response, event_type):
-        """Determine if a network request is relevant for PDF bug investigation"""
-        url = request_or_response.url.lower()
-        
-        # Zoovu-specific requests (high priority)
-        if any(domain in url for domain in ['zoovu.com', 'barracuda-cdn.zoovu.com', 'orca-exd-global-components.zoovu.com', 'zoovu-components-library.zoovu.com']):
-            return True
-        
-        # PDF generation related requests
-        if any(keyword in url for keyword in ['pdf', 'canvas', 'blob', 'screenshot', 'render', 'export']):
-            return True
+    def _classify_network_request(self, request_or_response, event_type):
+        """Determine relevance and category of a network request in a single pass over its URL"""
+        found = _match_keyword_categories(_NETWORK_KEYWORD_RE, request_or_response.url.lower(), 'zoovu_request')
         
-        # Image/asset loading failures that could cause missing images in PDFs
-        if any(keyword in url for keyword in ['image', 'asset', 'static', 'media']) and event_type in ['failed', 'response']:
-            if event_type == 'failed':
-                return True
-            elif event_type == 'response' and hasattr(request_or_response, 'status') and request_or_response.status >= 400:
-                return True
+        # Highest-priority category wins: zoovu > pdf_generation > image_loading > lead_generation
+        relevance = 'other'
+        for category in _NETWORK_RELEVANCE_ORDER:
+            if category in found:
+                relevance = category
+                break
         
-        # Email/lead gen form submission failures
-        if any(keyword in url for keyword in ['email', 'lead', 'form', 'submit', 'contact']) and event_type in ['failed', 'response']:
-            if event_type == 'failed':
-                return True
-            elif event_type == 'response' and hasattr(request_or_response, 'status') and request_or_response.status >= 400:
-                return True
+        # Zoovu-specific and PDF generation related requests are always relevant
+        if relevance in ('zoovu_request', 'pdf_generation'):
+            return True, relevance
         
         # Failed requests are always relevant
         if event_type == 'failed':
-            return True
+            return True, relevance
         
-        return False
-
-    def _get_network_request_relevance(self, url):
-        """Get the relevance category for a network request"""
-        url_lower = url.lower()
+        # Image/asset loading and lead gen form failures that could cause missing images in PDFs
+        if relevance in ('image_loading', 'lead_generation') and event_type == 'response':
+            if hasattr(request_or_response, 'status') and request_or_response.status >= 400:
+                return True, relevance
         
-        if any(domain in url_lower for domain in ['zoovu.com', 'barracuda-cdn.zoovu.com', 'orca-exd-global-components.zoovu.com', 'zoovu-components-library.zoovu.com']):
-            return 'zoovu_request'
-        elif any(keyword in url_lower for keyword in ['pdf', 'canvas', 'blob', 'screenshot', 'render', 'export']):
-            return 'pdf_generation'
-        elif any(keyword in url_lower for keyword in ['image', 'asset', 'static', 'media']):
-            return 'image_loading'
-        elif any(keyword in url_lower for keyword in ['email', 'lead', 'form', 'submit', 'contact']):
-            return 'lead_generation'
-        else:
-            return 'other'
+        return False, relevance
 
     def capture_page_error(self, error):
         """Capture page errors"""
-        self.logger.error(f"Page Error: {error}")
+        self.logger.error("Page Error: %s", error)
 
-    def capture_performance_metrics(self, page: Page, run_number: int, step_name: str = None):
-        """Capture performance metrics including memory usage"""
+    def capture_performance_metrics(self, page: Page, run_number: int, step_name: str = None, full: bool = False):
+        """Capture performance metrics including memory usage
+        
+        Only the live memory snapshot is fetched by default; pass full=True once
+        the page has loaded to also (re)capture navigation and paint timings.
+        Returns the memory usage percentage, or None if capture failed.
+        """
         try:
+            perf = self.stats['performance_metrics']
+            
             # Get browser performance metrics
-            metrics = page.evaluate("""
-                () => {
-                    const performance = window.performance;
-                    const memory = performance.memory || {};
-                    const navigation = performance.getEntriesByType('navigation')[0] || {};
-                    
-                    return {
-                        timestamp: Date.now(),
-                        memory: {
-                            used: memory.usedJSHeapSize || 0,
-                            total: memory.totalJSHeapSize || 0,
-                            limit: memory.jsHeapSizeLimit || 0
-                        },
-                        navigation: {
-                            load_time: navigation.loadEventEnd - navigation.loadEventStart || 0,
-                            dom_content_loaded: navigation.domContentLoadedEventEnd - navigation.domContentLoadedEventStart || 0,
-                            first_paint: performance.getEntriesByType('paint').find(entry => entry.name === 'first-paint')?.startTime || 0,
-                            first_contentful_paint: performance.getEntriesByType('paint').find(entry => entry.name === 'first-contentful-paint')?.startTime || 0
-                        },
-                        timing: {
-                            now: performance.now()
-                        }
-                    };
-                }
-            """)
+            if full:
+                live, static = page.evaluate("() => [window.__btPerfLive(), window.__btPerfStatic()]")
+                perf.navigation[run_number] = static
+            else:
+                live = page.evaluate("() => window.__btPerfLive()")
             
-            # Add run context
-            metrics['run_number'] = run_number
-            metrics['step_name'] = step_name
-            metrics['memory_usage_percent'] = (metrics['memory']['used'] / metrics['memory']['limit']) * 100 if metrics['memory']['limit'] > 0 else 0
+            memory_usage_percent = (live['used'] / live['limit']) * 100 if live['limit'] > 0 else 0
+            perf.append(run_number, step_name, live['timestamp'],
+                        live['used'], live['total'], live['limit'], memory_usage_percent, live['now'])
             
-            self.stats['performance_metrics'].append(metrics)
+            self._record_memory(run_number, memory_usage_percent)
             
             # Log memory pressure warnings
-            if metrics['memory_usage_percent'] > 80:
-                self.logger.warning(f"🚨 HIGH MEMORY USAGE: {metrics['memory_usage_percent']:.1f}% (Run {run_number})")
-            elif metrics['memory_usage_percent'] > 60:
-                self.logger.info(f"⚠️  Elevated memory usage: {metrics['memory_usage_percent']:.1f}% (Run {run_number})")
+            if memory_usage_percent > 80:
+                self.logger.warning("🚨 HIGH MEMORY USAGE: %.1f%% (Run %d)", memory_usage_percent, run_number)
+            elif memory_usage_percent > 60:
+                self.logger.info("⚠️  Elevated memory usage: %.1f%% (Run %d)", memory_usage_percent, run_number)
             
-            return metrics
+            return memory_usage_percent
             
         except Exception as e:
-            self.logger.warning(f"Failed to capture performance metrics: {e}")
+            self.logger.warning("Failed to capture performance metrics: %s", e)
+            return None
+
+    def _record_memory(self, run_number: int, memory_usage_percent: float):
+        """Update the overall and per-run memory aggregates with one measurement"""
+        with self._stats_lock:
+            agg = self.stats['_agg']
+            agg['memory_sum'] += memory_usage_percent
+            agg['memory_count'] += 1
+            if agg['memory_peak'] is None or memory_usage_percent > agg['memory_peak']:
+                agg['memory_peak'] = memory_usage_percent
+            if memory_usage_percent > 60:
+                agg['elevated_memory_count'] += 1
+                if memory_usage_percent > 80:
+                    agg['high_memory_count'] += 1
+                    self._run_mem_high[run_number] += 1
+                    if memory_usage_percent > 90:
+                        agg['critical_memory_count'] += 1
+            
+            self._run_mem_sum[run_number] += memory_usage_percent
+            self._run_mem_n[run_number] += 1
+            if memory_usage_percent > self._run_mem_peak.get(run_number, float('-inf')):
+                self._run_mem_peak[run_number] = memory_usage_percent
+            self._first_mem_pct.setdefault(run_number, memory_usage_percent)
+            self._last_mem_pct[run_number] = memory_usage_percent
+
+    def _record_run_time(self, run_time: float):
+        """Append a run time and update the run time aggregates"""
+        with self._stats_lock:
+            self.stats['run_times'].append(run_time)
+            agg = self.stats['_agg']
+            agg['run_time_sum'] += run_time
+            if agg['run_time_min'] is None or run_time < agg['run_time_min']:
+                agg['run_time_min'] = run_time
+            if agg['run_time_max'] is None or run_time > agg['run_time_max']:
+                agg['run_time_max'] = run_time
+
+    def _average_run_time(self) -> Optional[float]:
+        """Average run time from the running aggregates, or None before any run completes"""
+        if not self.stats['run_times']:
             return None
+        return self.stats['_agg']['run_time_sum'] / len(self.stats['run_times'])
+
+    def _success_rate(self) -> float:
+        """Percentage of successful runs, or 0 when no run has been recorded"""
+        if not self.stats['total_runs']:
+            return 0.0
+        return (self.stats['successful_runs'] / self.stats['total_runs']) * 100
 
     def detect_performance_degradation(self, current_run: int):
-        """Detect performance degradation across runs"""
-        if current_run < 2:
+        """Detect performance degradation across runs
+        
+        Each run is compared with the previous run in the same browser; with
+        round-robin workers that is the run `workers` places earlier, since the
+        run just before it executes concurrently in another browser.
+        """
+        previous_run = current_run - self.workers
+        if previous_run < 1:
             return
         
         try:
-            # Get performance metrics for current and previous runs
-            current_metrics = [m for m in self.stats['performance_metrics'] if m['run_number'] == current_run]
-            previous_metrics = [m for m in self.stats['performance_metrics'] if m['run_number'] == current_run - 1]
+            # Get metric counts for current and previous runs
+            current_count = self._run_mem_n.get(current_run, 0)
+            previous_count = self._run_mem_n.get(previous_run, 0)
             
-            if not current_metrics or not previous_metrics:
+            if not current_count or not previous_count:
                 return
             
-            # Calculate averages
-            current_avg_memory = sum(m['memory_usage_percent'] for m in current_metrics) / len(current_metrics)
-            previous_avg_memory = sum(m['memory_usage_percent'] for m in previous_metrics) / len(previous_metrics)
+            # Calculate averages from running sums
+            current_avg_memory = self._run_mem_sum[current_run] / current_count
+            previous_avg_memory = self._run_mem_sum[previous_run] / previous_count
             
             # Detect degradation patterns
             memory_increase = current_avg_memory - previous_avg_memory
@@ -350,42 +952,44 @@ class BostonTecStressTest:
                 }
                 
                 self.stats['performance_degradation'].append(degradation)
-                self.logger.warning(f"📉 PERFORMANCE DEGRADATION DETECTED: Memory usage increased by {memory_increase:.1f}% (Run {current_run})")
+                self.logger.warning("📉 PERFORMANCE DEGRADATION DETECTED: Memory usage increased by %.1f%% (Run %d)", memory_increase, current_run)
                 
                 # Check if this could indicate memory pressure
                 if current_avg_memory > 70:
-                    self.logger.error(f"🚨 MEMORY PRESSURE WARNING: {current_avg_memory:.1f}% memory usage - PDF generation may fail!")
+                    self.logger.error("🚨 MEMORY PRESSURE WARNING: %.1f%% memory usage - PDF generation may fail!", current_avg_memory)
             
         except Exception as e:
-            self.logger.warning(f"Error detecting performance degradation: {e}")
+            self.logger.warning("Error detecting performance degradation: %s", e)
 
     def force_garbage_collection(self, page: Page):
-        """Attempt to trigger garbage collection to free memory"""
+        """Trigger a full V8 garbage collection (window.gc is exposed via --expose-gc)"""
         try:
-            page.evaluate("""
-                () => {
-                    if (window.gc) {
-                        window.gc();
-                        return 'Garbage collection triggered';
-                    } else {
-                        // Try to trigger GC by creating and releasing large objects
-                        for (let i = 0; i < 10; i++) {
-                            const largeArray = new Array(1000000).fill(0);
-                            largeArray.length = 0;
-                        }
-                        return 'Memory cleanup attempted';
-                    }
-                }
-            """)
-            self.logger.info("🧹 Attempted memory cleanup")
+            page.evaluate("() => { window.gc && window.gc(); }")
+            self.logger.info("🧹 Triggered garbage collection")
         except Exception as e:
             self.logger.warning(f"Failed to trigger garbage collection: {e}")
 
+    def reset_session(self, page: Page):
+        """Clear cookies and web storage so the next run starts as a fresh visitor
+        
+        The context and page are kept, so the browser process and its compiled
+        code caches stay warm across runs.
+        """
+        try:
+            page.context.clear_cookies()
+            page.evaluate("() => { try { localStorage.clear(); sessionStorage.clear(); } catch (e) {} }")
+        except Exception as e:
+            self.logger.warning(f"Failed to reset session state: {e}")
+
     def load_test_path(self) -> List[Dict]:
         """Load and validate the test path from JSON file"""
         try:
-            with open(self.test_path_file, 'r') as f:
-                steps = json.load(f)
+            steps = _json_loads(Path(self.test_path_file).read_bytes())
+            
+            # Resolve selectors once; every run reuses them
+            for step in steps:
+                if 'selector_type' in step:
+                    step['_resolved_selector'] = _resolve_selector(step)
             
             self.logger.info(f"Loaded {len(steps)} test steps from {self.test_path_file}")
             return steps
@@ -393,38 +997,22 @@ class BostonTecStressTest:
             self.logger.error(f"Failed to load test path: {e}")
             raise
 
-    def locate_element(self, page: Page, step: Dict) -> Optional[Tuple[str, str]]:
-        """Locate an element based on selector type and value"""
-        selector_type = step['selector_type']
-        selector_value = step['selector_value']
+    def locate_element(self, page: Page, step: Dict) -> Optional[Locator]:
+        """Locate an element using the selector resolved at load time
         
+        No existence probe is made here; Playwright auto-waits for the element
+        when it is acted on.
+        """
         try:
-            if selector_type == "text":
-                base = step.get('base', 'button')
-                element = page.locator(f"{base}:has-text('{selector_value}')").first
-                if element.count() > 0:
-                    return "text", f"{base}:has-text('{selector_value}')"
-            
-            elif selector_type == "testid":
-                element = page.locator(f'[data-testid="{selector_value}"]').first
-                if element.count() > 0:
-                    return "testid", f'[data-testid="{selector_value}"]'
-            
-            elif selector_type == "composite":
-                element = page.locator(selector_value).first
-                if element.count() > 0:
-                    return "composite", selector_value
-            
-            elif selector_type == "section_product":
-                element = page.locator(f'[data-testid="section-product"].zv-product-{selector_value}').first
-                if element.count() > 0:
-                    return "section_product", f'[data-testid="section-product"].zv-product-{selector_value}'
+            selector = step.get('_resolved_selector')
+            if selector is None:
+                return None
             
-            return None, None
+            return page.locator(selector).first
             
         except Exception as e:
             self.logger.error(f"Error locating element: {e}")
-            return None, None
+            return None
 
     def execute_step(self, page: Page, step: Dict, run_number: int, step_number: int) -> bool:
         """Execute a single test step with enhanced logging"""
@@ -434,34 +1022,42 @@ class BostonTecStressTest:
         self.logger.info(f"Run {run_number}, Step {step_number}: {step_name} - {action}")
         
         try:
-            # Wait for page to be ready
-            try:
-                page.wait_for_load_state('domcontentloaded', timeout=5000)
-            except:
-                pass
+            # Wait for page to be ready, unless an earlier step already saw this URL loaded
+            if self._dom_ready_url.get(page) != page.url:
+                try:
+                    page.wait_for_load_state('domcontentloaded', timeout=5000)
+                    self._dom_ready_url[page] = page.url
+                except PlaywrightTimeoutError:
+                    pass
             
             if action == "click":
-                selector_type, selector = self.locate_element(page, step)
-                if selector:
-                    element = page.locator(selector).first
+                element = self.locate_element(page, step)
+                if element is not None:
+                    debug_state = self.debug_elements and self.logger.isEnabledFor(logging.INFO)
                     
                     # Capture element state before click
-                    try:
-                        before_state = self.capture_element_state(element, "before")
-                        self.logger.info(f"  📊 Element state before: {before_state}")
-                    except:
-                        pass
+                    if debug_state:
+                        try:
+                            before_state = self.capture_element_state(element, "before")
+                            self.logger.info(f"  📊 Element state before: {before_state}")
+                        except:
+                            pass
                     
-                    element.click()
-                    self.logger.info(f"  ✓ Clicked element: {selector}")
+                    # click() auto-waits for the element; a timeout means it never appeared
+                    try:
+                        element.click(timeout=5000)
+                    except PlaywrightTimeoutError:
+                        self.logger.error(f"  ✗ Element not found for step: {step_name}")
+                        return False
+                    self.logger.info(f"  ✓ Clicked element: {step['_resolved_selector']}")
                     
                     # Capture element state after click
-                    try:
-                        time.sleep(0.5)
-                        after_state = self.capture_element_state(element, "after")
-                        self.logger.info(f"  📊 Element state after: {after_state}")
-                    except:
-                        pass
+                    if debug_state:
+                        try:
+                            after_state = self.capture_element_state(element, "after")
+                            self.logger.info(f"  📊 Element state after: {after_state}")
+                        except:
+                            pass
                     
                     return True
                 else:
@@ -469,26 +1065,52 @@ class BostonTecStressTest:
                     return False
             
             elif action == "increment_quantity":
-                selector_type, selector = self.locate_element(page, step)
-                if selector:
-                    section = page.locator(selector).first
-                    
-                    if section.count() > 0:
-                        increment_button = section.locator('[data-testid="increment-button"]').first
-                        if increment_button.count() > 0:
-                            increment_button.click()
-                            self.logger.info(f"  ✓ Incremented quantity in section: {step['selector_value']}")
-                            return True
-                        else:
-                            self.logger.error(f"  ✗ Increment button not found in section: {step['selector_value']}")
-                            return False
-                    else:
-                        self.logger.error(f"  ✗ Section not found: {step['selector_value']}")
+                section = self.locate_element(page, step)
+                if section is not None:
+                    # One auto-waiting click on the chained locator; a timeout means the
+                    # section or its increment button never appeared
+                    try:
+                        section.locator('[data-testid="increment-button"]').first.click(timeout=5000)
+                    except PlaywrightTimeoutError:
+                        self.logger.error(f"  ✗ Increment button not found in section: {step['selector_value']}")
                         return False
+                    self.logger.info(f"  ✓ Incremented quantity in section: {step['selector_value']}")
+                    return True
                 else:
                     self.logger.error(f"  ✗ Could not locate section for increment: {step['step']}")
                     return False
             
+            elif action == "export_pdf":
+                element = self.locate_element(page, step)
+                if element is not None:
+                    # Wait on the download event itself rather than sleeping after the click.
+                    # A click timeout cancels the wait, so `clicked` tells the two failures apart.
+                    clicked = False
+                    try:
+                        with page.expect_download(timeout=30000) as download_info:
+                            element.click(timeout=5000)
+                            clicked = True
+                        download = download_info.value
+                    except PlaywrightTimeoutError:
+                        if clicked:
+                            self.logger.error(f"  ✗ PDF export did not start a download for step: {step_name}")
+                        else:
+                            self.logger.error(f"  ✗ Element not found for step: {step_name}")
+                        return False
+                    
+                    failure = download.failure()
+                    if failure:
+                        self.logger.error(f"  ✗ PDF download failed: {failure}")
+                        return False
+                    
+                    pdf_path = f"run_{run_number}_export.pdf"
+                    download.save_as(pdf_path)
+                    self.logger.info(f"  ✓ PDF exported: {pdf_path}")
+                    return True
+                else:
+                    self.logger.error(f"  ✗ Element not found for step: {step_name}")
+                    return False
+            
             else:
                 self.logger.error(f"  ✗ Unknown action: {action}")
                 return False
@@ -502,21 +1124,13 @@ class BostonTecStressTest:
     def capture_element_state(self, element, state_label):
         """Capture the state of an element for debugging"""
         try:
-            state = {
-                'visible': element.is_visible(),
-                'enabled': element.is_enabled(),
-                'classes': element.evaluate('el => Array.from(el.classList)'),
-                'text': element.text_content()[:100] if element.text_content() else 'No text',
-                'tag_name': element.evaluate('el => el.tagName'),
-                'attributes': element.evaluate('el => Object.fromEntries(Array.from(el.attributes).map(attr => [attr.name, attr.value]))')
-            }
-            return state
+            return element.evaluate(ELEMENT_STATE_SCRIPT)
         except Exception as e:
             return f"Error capturing state: {e}"
 
     def execute_test_run(self, page: Page, run_number: int) -> bool:
         """Execute a single test run with performance monitoring"""
-        start_time = time.time()
+        start_ns = self._now_ns()
         
         try:
             # Capture initial performance metrics
@@ -529,12 +1143,15 @@ class BostonTecStressTest:
             except Exception as e:
                 self.logger.warning(f"DOM content load timeout: {e}")
             
-            # Give page time to render dynamic content
-            time.sleep(5)
-            self.logger.info("Waited for dynamic content")
+            # Wait for dynamic content to finish loading instead of a fixed delay
+            try:
+                page.wait_for_load_state('networkidle', timeout=8000)
+                self.logger.info("Network idle, dynamic content loaded")
+            except Exception as e:
+                self.logger.warning(f"Network idle timeout: {e}")
             
             # Capture performance after page load
-            self.capture_performance_metrics(page, run_number, "page_loaded")
+            self.capture_performance_metrics(page, run_number, "page_loaded", full=True)
             
             # Execute each step with performance monitoring
             for i, step in enumerate(self.test_steps, 1):
@@ -553,19 +1170,14 @@ class BostonTecStressTest:
                 self.detect_performance_degradation(run_number)
                 
                 # Force garbage collection if memory usage is high
-                current_metrics = [m for m in self.stats['performance_metrics'] if m['run_number'] == run_number and m['step_name'] == f"after_step_{i}"]
-                if current_metrics and current_metrics[-1]['memory_usage_percent'] > 70:
+                if self._last_mem_pct.get(run_number, 0) > 70:
                     self.force_garbage_collection(page)
-                    time.sleep(2)  # Give GC time to work
-                
-                # Small delay between steps
-                time.sleep(1)
             
             # Capture final performance metrics
             self.capture_performance_metrics(page, run_number, "completed")
             
-            run_time = time.time() - start_time
-            self.stats['run_times'].append(run_time)
+            run_time = (self._now_ns() - start_ns) / 1e9
+            self._record_run_time(run_time)
             self.logger.info(f"Test run {run_number} completed successfully in {run_time:.2f} seconds")
             return True
             
@@ -583,168 +1195,221 @@ class BostonTecStressTest:
         self.logger.info(f"Smart filtering: Zoovu errors, PDF generation, memory pressure, image loading")
         self.logger.info(f"Memory monitoring: Enabled with pressure detection and PDF bug correlation")
         
+        # More browsers than runs would leave idle workers with nothing to do
+        self.workers = max(1, min(self.workers, self.iterations))
+        
+        self._io_pool = ThreadPoolExecutor(max_workers=2)
+        try:
+            if self.workers > 1:
+                # Each worker drives its own browser; Playwright's sync API is bound to the thread that started it
+                self.logger.info(f"Workers: {self.workers} (one browser per worker)")
+                with ThreadPoolExecutor(max_workers=self.workers) as pool:
+                    futures = [pool.submit(self._run_worker, list(range(worker, self.iterations + 1, self.workers)))
+                               for worker in range(1, self.workers + 1)]
+                    for future in futures:
+                        future.result()
+            else:
+                self._run_worker(list(range(1, self.iterations + 1)))
+        finally:
+            # Make sure all queued screenshots are flushed to disk, even if a worker failed
+            self._io_pool.shutdown(wait=True)
+        
+        self.print_summary()
+        
+        # The JSON export and the PDF build are independent; overlap them.
+        # print_summary has already filled the memory analysis cache both read.
+        with ThreadPoolExecutor(max_workers=1) as export_pool:
+            export = export_pool.submit(self.save_detailed_data)
+            if self.generate_pdf:
+                self.generate_pdf_report()
+            export.result()
+        
+        if self.generate_html:
+            self.generate_html_report()
+        
+        if self.deploy_reports:
+            self.deploy_to_github_pages()
+
+    def _run_worker(self, runs: List[int]):
+        """Launch (or attach to) a browser and execute the given test runs in one page
+        
+        With cdp_endpoint set, every worker connects to the same running
+        Chromium and works in its own context instead of spawning a browser.
+        """
         with sync_playwright() as p:
-            # Launch browser once
-            browser = p.chromium.launch(headless=self.headless)
-            self.logger.info("🌐 Launched Chromium browser")
+            if self.cdp_endpoint:
+                browser = p.chromium.connect_over_cdp(self.cdp_endpoint)
+                self.logger.info(f"🌐 Connected to Chromium at {self.cdp_endpoint}")
+            else:
+                browser = p.chromium.launch(headless=self.headless, args=['--js-flags=--expose-gc'])
+                self.logger.info("🌐 Launched Chromium browser")
             
             # Create single context and page
             context = browser.new_context()
             page = context.new_page()
+            page.add_init_script(PERFORMANCE_INIT_SCRIPT)
+            self.block_third_party_requests(context, page)
             
             # Setup comprehensive page listeners
             self.setup_page_listeners(page)
             self.logger.info("📡 Setup page event listeners for comprehensive logging")
             
             try:
-                for run in range(1, self.iterations + 1):
-                    self.logger.info(f"\n{'='*60}")
-                    self.logger.info(f"Starting Test Run {run}/{self.iterations}")
-                    self.logger.info(f"{'='*60}")
-                    
-                    # Navigate to the target URL for each run
-                    page.goto(self.target_url)
-                    self.logger.info(f"Loaded page: {self.target_url}")
-                    
-                    # Execute the test run
-                    success = self.execute_test_run(page, run)
-                    
-                    self.stats['total_runs'] += 1
+                for run in runs:
+                    self._run_iteration(page, run)
                     
-                    if success:
-                        self.stats['successful_runs'] += 1
-                        self.logger.info(f"✅ Test run {run} completed successfully")
-                    else:
-                        self.stats['failed_runs'] += 1
-                        self.logger.error(f"❌ Test run {run} failed")
-                    
-                    # Take screenshot after each run
-                    screenshot_path = f"run_{run}_final_state.png"
-                    page.screenshot(path=screenshot_path)
-                    self.logger.info(f"Screenshot saved: {screenshot_path}")
+                    # Reset session state between runs; the next run waits for the
+                    # reloaded page to go network-idle instead of a fixed pause
+                    if run != runs[-1]:
+                        self.reset_session(page)
                     
-                    # Small delay between runs
-                    if run < self.iterations:
-                        self.logger.info("⏳ Waiting 3 seconds before next iteration...")
-                        time.sleep(3)
-                        
             finally:
-                # Keep browser open for manual inspection
-                self.logger.info(f"\n🔍 All {self.iterations} iterations completed!")
-                self.logger.info("Browser will remain open for manual inspection.")
-                self.logger.info("Close the browser window when you're done, or press Enter to close automatically...")
-                input()
+                self.logger.info(f"\n🔍 Runs {', '.join(map(str, runs))} completed!")
+                
+                # Keep browser open for manual inspection, if requested
+                if self.inspect_seconds > 0:
+                    self.logger.info(f"Browser will remain open for {self.inspect_seconds} seconds for manual inspection...")
+                    time.sleep(self.inspect_seconds)
+                elif self.interactive and self.workers == 1:
+                    self.logger.info("Browser will remain open for manual inspection.")
+                    self.logger.info("Close the browser window when you're done, or press Enter to close automatically...")
+                    input()
                 
                 context.close()
-                browser.close()
-                self.logger.info("🔒 Browser closed")
+                browser.close()  # Only disconnects when attached over CDP
+                self.logger.info("🔒 Browser disconnected" if self.cdp_endpoint else "🔒 Browser closed")
+
+    def _run_iteration(self, page: Page, run: int):
+        """Load the configurator, execute one test run and record its outcome"""
+        self.logger.info(f"\n{'='*60}")
+        self.logger.info(f"Starting Test Run {run}/{self.iterations}")
+        self.logger.info(f"{'='*60}")
         
-        self.print_summary()
-        self.save_detailed_data()
+        # Navigate to the target URL for each run
+        self._dom_ready_url.pop(page, None)
+        page.goto(self.target_url)
+        self.logger.info(f"Loaded page: {self.target_url}")
         
-        if self.generate_pdf:
-            self.generate_pdf_report()
+        # Execute the test run
+        success = self.execute_test_run(page, run)
         
-        if self.generate_html:
-            self.generate_html_report()
+        with self._stats_lock:
+            self.stats['total_runs'] += 1
+            if success:
+                self.stats['successful_runs'] += 1
+            else:
+                self.stats['failed_runs'] += 1
         
-        if self.deploy_reports:
-            self.deploy_to_github_pages()
+        if success:
+            self.logger.info(f"✅ Test run {run} completed successfully")
+        else:
+            self.logger.error(f"❌ Test run {run} failed")
+        
+        # Take screenshot after each run (written in the background)
+        if self.capture_screenshots:
+            screenshot_path = f"run_{run}_final_state.jpg"
+            data = page.screenshot(type='jpeg', quality=70, full_page=False)
+            self._io_pool.submit(Path(screenshot_path).write_bytes, data)
+            self.logger.info(f"Screenshot saved: {screenshot_path}")
 
     def print_summary(self):
-        """Print comprehensive test execution summary"""
-        self.logger.info(f"\n{'='*60}")
-        self.logger.info("BOSTONTEC STRESS TEST SUMMARY")
-        self.logger.info(f"{'='*60}")
-        self.logger.info(f"Total Runs: {self.stats['total_runs']}")
-        self.logger.info(f"Successful: {self.stats['successful_runs']}")
-        self.logger.info(f"Failed: {self.stats['failed_runs']}")
+        """Print comprehensive test execution summary
+        
+        Lines are gathered per log level and emitted in a few multi-line
+        records instead of one logger call per line.
+        """
+        lines = [
+            f"\n{'='*60}",
+            "BOSTONTEC STRESS TEST SUMMARY",
+            f"{'='*60}",
+            f"Total Runs: {self.stats['total_runs']}",
+            f"Successful: {self.stats['successful_runs']}",
+            f"Failed: {self.stats['failed_runs']}",
+        ]
         
-        if self.stats['run_times']:
-            avg_time = sum(self.stats['run_times']) / len(self.stats['run_times'])
-            self.logger.info(f"Average Run Time: {avg_time:.2f} seconds")
-            self.logger.info(f"Fastest Run: {min(self.stats['run_times']):.2f} seconds")
-            self.logger.info(f"Slowest Run: {max(self.stats['run_times']):.2f} seconds")
+        avg_time = self._average_run_time()
+        if avg_time is not None:
+            lines.append(f"Average Run Time: {avg_time:.2f} seconds")
+            lines.append(f"Fastest Run: {self.stats['_agg']['run_time_min']:.2f} seconds")
+            lines.append(f"Slowest Run: {self.stats['_agg']['run_time_max']:.2f} seconds")
         
-        success_rate = (self.stats['successful_runs'] / self.stats['total_runs']) * 100
-        self.logger.info(f"Success Rate: {success_rate:.1f}%")
+        lines.append(f"Success Rate: {self._success_rate():.1f}%")
         
         # Logging statistics
-        self.logger.info(f"\n📊 ENHANCED LOGGING STATISTICS:")
-        self.logger.info(f"Console Logs Captured: {len(self.stats['console_logs'])}")
-        self.logger.info(f"Network Requests Tracked: {len(self.stats['network_requests'])}")
-        self.logger.info(f"Performance Metrics Captured: {len(self.stats['performance_metrics'])}")
-        self.logger.info(f"Performance Degradation Events: {len(self.stats['performance_degradation'])}")
+        lines.append(f"\n📊 ENHANCED LOGGING STATISTICS:")
+        lines.append(f"Console Logs Captured: {len(self.stats['console_logs'])}")
+        lines.append(f"Network Requests Tracked: {len(self.stats['network_requests'])}")
+        lines.append(f"Performance Metrics Captured: {len(self.stats['performance_metrics'])}")
+        lines.append(f"Performance Degradation Events: {len(self.stats['performance_degradation'])}")
         
         # Console log summary with relevance breakdown
-        if self.stats['console_logs']:
-            error_logs = [log for log in self.stats['console_logs'] if log['level'] == 'error']
-            warning_logs = [log for log in self.stats['console_logs'] if log['level'] == 'warning']
-            self.logger.info(f"Relevant Console Errors: {len(error_logs)}")
-            self.logger.info(f"Relevant Console Warnings: {len(warning_logs)}")
+        console_logs = self.stats['console_logs']
+        if console_logs:
+            level_counts, relevance_counts = console_logs.tally()
+            lines.append(f"Relevant Console Errors: {level_counts['error']}")
+            lines.append(f"Relevant Console Warnings: {level_counts['warning']}")
             
             # Breakdown by relevance
-            relevance_counts = {}
-            for log in self.stats['console_logs']:
-                relevance = log.get('relevance', 'other')
-                relevance_counts[relevance] = relevance_counts.get(relevance, 0) + 1
-            
-            self.logger.info(f"📊 Console Log Breakdown:")
-            for relevance, count in relevance_counts.items():
-                self.logger.info(f"  {relevance}: {count} logs")
+            lines.append(f"📊 Console Log Breakdown:")
+            lines.extend(f"  {relevance}: {count} logs" for relevance, count in relevance_counts.most_common())
         
         # Network request summary with relevance breakdown
-        if self.stats['network_requests']:
-            failed_requests = [req for req in self.stats['network_requests'] if req['event'] == 'failed']
-            error_responses = [req for req in self.stats['network_requests'] if req['event'] == 'response' and req.get('status', 200) >= 400]
-            self.logger.info(f"Relevant Failed Network Requests: {len(failed_requests)}")
-            self.logger.info(f"Relevant Error Responses (4xx/5xx): {len(error_responses)}")
+        network_requests = self.stats['network_requests']
+        if network_requests:
+            event_counts, relevance_counts = network_requests.tally()
+            lines.append(f"Relevant Failed Network Requests: {event_counts['failed']}")
+            lines.append(f"Relevant Error Responses (4xx/5xx): {network_requests.count_error_responses()}")
             
             # Breakdown by relevance
-            relevance_counts = {}
-            for req in self.stats['network_requests']:
-                relevance = req.get('relevance', 'other')
-                relevance_counts[relevance] = relevance_counts.get(relevance, 0) + 1
-            
-            self.logger.info(f"📊 Network Request Breakdown:")
-            for relevance, count in relevance_counts.items():
-                self.logger.info(f"  {relevance}: {count} requests")
+            lines.append(f"📊 Network Request Breakdown:")
+            lines.extend(f"  {relevance}: {count} requests" for relevance, count in relevance_counts.most_common())
         
         # Performance summary
-        if self.stats['performance_metrics']:
-            memory_metrics = [m for m in self.stats['performance_metrics'] if 'memory_usage_percent' in m]
-            if memory_metrics:
-                max_memory = max(m['memory_usage_percent'] for m in memory_metrics)
-                avg_memory = sum(m['memory_usage_percent'] for m in memory_metrics) / len(memory_metrics)
-                self.logger.info(f"Peak Memory Usage: {max_memory:.1f}%")
-                self.logger.info(f"Average Memory Usage: {avg_memory:.1f}%")
-                
-                # Memory pressure warnings
-                high_memory_events = [m for m in memory_metrics if m['memory_usage_percent'] > 80]
-                if high_memory_events:
-                    self.logger.warning(f"🚨 HIGH MEMORY EVENTS: {len(high_memory_events)} instances > 80% memory usage")
+        warnings = []
+        memory_analysis = self._analyze_memory_patterns()
+        if 'error' not in memory_analysis:
+            lines.append(f"Peak Memory Usage: {memory_analysis['peak_memory_usage']:.1f}%")
+            lines.append(f"Average Memory Usage: {memory_analysis['average_memory_usage']:.1f}%")
+            percentiles = memory_analysis['memory_percentiles']
+            if percentiles['p50'] is not None:
+                lines.append(f"Memory Usage p50/p95/p99: {percentiles['p50']:.1f}% / {percentiles['p95']:.1f}% / {percentiles['p99']:.1f}%")
+            
+            # Memory pressure warnings
+            high_memory_events = memory_analysis['memory_pressure_events']['high_usage_80_plus']
+            if high_memory_events:
+                warnings.append(f"🚨 HIGH MEMORY EVENTS: {high_memory_events} instances > 80% memory usage")
         
         # Performance degradation summary
         if self.stats['performance_degradation']:
-            self.logger.warning(f"📉 PERFORMANCE DEGRADATION: {len(self.stats['performance_degradation'])} events detected")
-            for degradation in self.stats['performance_degradation']:
-                self.logger.warning(f"  - Run {degradation['run_number']}: {degradation['increase_percent']:.1f}% memory increase")
-        
-        self.logger.info(f"\n📁 Detailed logs saved to: bostontec_stress_test.log")
-        self.logger.info(f"📸 Screenshots saved for each run")
-        self.logger.info(f"🔍 Check console logs and network requests for debugging insights")
+            warnings.append(f"📉 PERFORMANCE DEGRADATION: {len(self.stats['performance_degradation'])} events detected")
+            warnings.extend(f"  - Run {degradation['run_number']}: {degradation['increase_percent']:.1f}% memory increase"
+                            for degradation in self.stats['performance_degradation'])
+        
+        self.logger.info("\n".join(lines))
+        if warnings:
+            self.logger.warning("\n".join(warnings))
+        
+        closing = [f"\n📁 Detailed logs saved to: bostontec_stress_test.log"]
+        if self.capture_screenshots:
+            closing.append(f"📸 Screenshots saved for each run")
+        closing.append(f"🔍 Check console logs and network requests for debugging insights")
+        self.logger.info("\n".join(closing))
 
     def save_detailed_data(self):
-        """Save all captured data to a JSON file for detailed analysis"""
+        """Save all captured data to a JSON file for detailed analysis
+        
+        The event arrays are streamed record by record (one compact record per
+        line) rather than building the whole document in memory first.
+        """
         try:
             data_to_save = {
                 'test_summary': {
                     'total_runs': self.stats['total_runs'],
                     'successful_runs': self.stats['successful_runs'],
                     'failed_runs': self.stats['failed_runs'],
-                    'success_rate': (self.stats['successful_runs'] / self.stats['total_runs']) * 100 if self.stats['total_runs'] > 0 else 0,
-                    'run_times': self.stats['run_times'],
-                    'average_run_time': sum(self.stats['run_times']) / len(self.stats['run_times']) if self.stats['run_times'] else 0
+                    'success_rate': self._success_rate(),
+                    'run_times': self.stats['run_times'].tolist(),
+                    'average_run_time': self._average_run_time() or 0
                 },
                 'console_logs': self.stats['console_logs'],
                 'network_requests': self.stats['network_requests'],
@@ -757,52 +1422,88 @@ class BostonTecStressTest:
             }
             
             filename = f"bostontec_stress_test_data_{int(time.time())}.json"
-            with open(filename, 'w') as f:
-                json.dump(data_to_save, f, indent=2, default=str)
+            with open(filename, 'wb', buffering=1 << 20) as f:
+                f.write(b'{')
+                for i, (key, value) in enumerate(data_to_save.items()):
+                    f.write(b',\n' if i else b'\n')
+                    f.write(_json_bytes(key) + b': ')
+                    if isinstance(value, (ConsoleBuffer, NetworkBuffer, PerfBuffer)):
+                        f.write(b'[')
+                        for j, record in enumerate(value):
+                            f.write(b',\n' if j else b'\n')
+                            f.write(_json_bytes(record))
+                        f.write(b'\n]')
+                    else:
+                        f.write(_json_bytes(value, indent=True))
+                f.write(b'\n}\n')
             
             self.logger.info(f"💾 Detailed data saved to: {filename}")
             
+            # Spilled events are now in the export; drop their temporary files
+            self.stats['console_logs'].discard_spill()
+            self.stats['network_requests'].discard_spill()
+            
         except Exception as e:
             self.logger.error(f"Failed to save detailed data: {e}")
 
     def _analyze_memory_patterns(self):
-        """Analyze memory usage patterns for PDF bug correlation"""
+        """Analyze memory usage patterns for PDF bug correlation
+        
+        Built from the running aggregates and cached until more metrics are
+        captured, so the summary, data export and PDF sections share one result.
+        """
         try:
-            memory_metrics = [m for m in self.stats['performance_metrics'] if 'memory_usage_percent' in m]
+            agg = self.stats['_agg']
+            measurements = agg['memory_count']
             
-            if not memory_metrics:
+            if not measurements:
                 return {'error': 'No memory metrics available'}
             
+            if self._memory_analysis_cache is not None and self._memory_analysis_cache[0] == measurements:
+                return self._memory_analysis_cache[1]
+            
+            # One sort yields every percentile (nearest-rank)
+            ordered = sorted(self.stats['performance_metrics'].mem_pct)
+            
+            def percentile(p):
+                # Smallest value with at least p% of readings at or below it
+                return ordered[max(0, math.ceil(p * len(ordered) / 100) - 1)] if ordered else None
+            
             analysis = {
-                'total_measurements': len(memory_metrics),
-                'peak_memory_usage': max(m['memory_usage_percent'] for m in memory_metrics),
-                'average_memory_usage': sum(m['memory_usage_percent'] for m in memory_metrics) / len(memory_metrics),
+                'total_measurements': measurements,
+                'peak_memory_usage': agg['memory_peak'],
+                'average_memory_usage': agg['memory_sum'] / measurements,
+                'memory_percentiles': {
+                    'p50': percentile(50),
+                    'p95': percentile(95),
+                    'p99': percentile(99)
+                },
                 'memory_pressure_events': {
-                    'high_usage_80_plus': len([m for m in memory_metrics if m['memory_usage_percent'] > 80]),
-                    'elevated_usage_60_plus': len([m for m in memory_metrics if m['memory_usage_percent'] > 60]),
-                    'critical_usage_90_plus': len([m for m in memory_metrics if m['memory_usage_percent'] > 90])
+                    'high_usage_80_plus': agg['high_memory_count'],
+                    'elevated_usage_60_plus': agg['elevated_memory_count'],
+                    'critical_usage_90_plus': agg['critical_memory_count']
                 },
                 'run_analysis': {}
             }
             
-            # Analyze memory usage by run
-            for run_num in range(1, self.iterations + 1):
-                run_metrics = [m for m in memory_metrics if m['run_number'] == run_num]
-                if run_metrics:
-                    run_memory = [m['memory_usage_percent'] for m in run_metrics]
+            # Analyze memory usage by run from the per-run aggregates
+            for run_num in sorted(self._run_mem_n):
+                if 1 <= run_num <= self.iterations:
+                    count = self._run_mem_n[run_num]
                     analysis['run_analysis'][f'run_{run_num}'] = {
-                        'peak_memory': max(run_memory),
-                        'average_memory': sum(run_memory) / len(run_memory),
-                        'memory_trend': 'increasing' if len(run_memory) > 1 and run_memory[-1] > run_memory[0] else 'stable',
-                        'high_memory_events': len([m for m in run_metrics if m['memory_usage_percent'] > 80])
+                        'peak_memory': self._run_mem_peak[run_num],
+                        'average_memory': self._run_mem_sum[run_num] / count,
+                        'memory_trend': 'increasing' if count > 1 and self._last_mem_pct[run_num] > self._first_mem_pct[run_num] else 'stable',
+                        'high_memory_events': self._run_mem_high[run_num]
                     }
             
             # Correlation analysis
             analysis['pdf_bug_correlation'] = {
                 'high_memory_runs': [run for run, data in analysis['run_analysis'].items() if data['peak_memory'] > 80],
-                'memory_pressure_risk': 'HIGH' if analysis['peak_memory_usage'] > 85 else 'MEDIUM' if analysis['peak_memory_usage'] > 70 else 'LOW'
+                'memory_pressure_risk': _pressure_risk(analysis['peak_memory_usage'])
             }
             
+            self._memory_analysis_cache = (measurements, analysis)
             return analysis
             
         except Exception as e:
@@ -850,8 +1551,14 @@ class BostonTecStressTest:
 
     def generate_pdf_report(self):
         """Generate a professional PDF report with executive summary and technical findings"""
+        from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, PageBreak, Image
         try:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            # Derived values shared by the title page, footer and metrics table
+            generated_at = datetime.now()
+            success_rate = self._success_rate()
+            avg_run_time = self._average_run_time()
+            
+            timestamp = generated_at.strftime("%Y%m%d_%H%M%S")
             # Create pdf_reports directory if it doesn't exist
             os.makedirs('pdf_reports', exist_ok=True)
             filename = f"pdf_reports/bostontec_stress_test_report_{timestamp}.pdf"
@@ -865,276 +1572,235 @@ class BostonTecStressTest:
             from reportlab.platypus import BaseDocTemplate, PageTemplate, Frame
             from reportlab.lib.units import cm
             
+            footer_text = f"BostonTec 3D Workbench Builder - Stress Test Report | Generated: {generated_at.strftime('%B %d, %Y at %I:%M %p')}"
+            
             def add_footer(canvas, doc):
                 canvas.saveState()
                 # Add footer line
-                canvas.setStrokeColor(colors.HexColor('#e2e8f0'))
+                canvas.setStrokeColor(_hex_color('#e2e8f0'))
                 canvas.setLineWidth(1)
                 canvas.line(50, 30, A4[0]-50, 30)
                 # Add footer text
                 canvas.setFont('Helvetica', 8)
-                canvas.setFillColor(colors.HexColor('#718096'))
-                canvas.drawString(50, 15, f"BostonTec 3D Workbench Builder - Stress Test Report | Generated: {datetime.now().strftime('%B %d, %Y at %I:%M %p')}")
+                canvas.setFillColor(_hex_color('#718096'))
+                canvas.drawString(50, 15, footer_text)
                 canvas.restoreState()
             
-            # Get styles and create custom professional styles
-            styles = getSampleStyleSheet()
+            # Shared professional styles
+            styles = self._pdf_styles
+            title_style = styles['title']
+            subtitle_style = styles['subtitle']
+            heading_style = styles['heading']
+            
+            # Title page content, starting the professional branded title page with logos
+            title_page = [Spacer(1, 20)]
+            
+            
+            # Header with centered BostonTec logo
+            try:
+                # Add centered BostonTec logo
+                bostontec_img = Image(io.BytesIO(_logo_bytes('BOSTONtec-Logo.png')), width=150, height=50)
+                
+                # Create centered header
+                header_data = [[bostontec_img]]
+                header_table = Table(header_data, colWidths=_col_widths(1))
+                header_table.setStyle(_fixed_table_styles()['logo_header'])
+                title_page.extend([header_table, Spacer(1, 20)])
+                
+            except Exception as e:
+                # Fallback if logo can't be loaded - log the error
+                self.logger.error(f"Failed to load BostonTec logo: {e}")
+                title_page.extend([Paragraph("BostonTec", title_style), Spacer(1, 10)])
             
+            # Main title with better styling
+            title_page.extend([
+                Paragraph("3D Workbench Builder", title_style),
+                Paragraph("Stress Test Analysis Report", subtitle_style),
+                Spacer(1, 20),
+            ])
+            
+            # Compact metrics in a more professional layout
+            metrics_data = [
+                ['Test Information', 'Results', 'Performance'],
+                ['Date', generated_at.strftime('%B %d, %Y'), 'Success Rate'],
+                ['Time', generated_at.strftime('%I:%M %p'), f"{success_rate:.1f}%"],
+                ['Iterations', str(self.iterations), 'Avg Runtime'],
+                ['', '', f"{avg_run_time:.1f}s" if avg_run_time is not None else 'N/A']
+            ]
+            
+            metrics_table = Table(metrics_data, colWidths=_col_widths(1/3, 1/3, 1/3))
+            metrics_table.setStyle(_fixed_table_styles()['title_metrics'])
+            
+            title_page.extend([metrics_table, Spacer(1, 25), PageBreak()])
+            
+            # Remaining sections are generated lazily, one at a time, as the document is laid out
+            sections = (
+                title_page,
+                self._pdf_section("Executive Summary", heading_style, self._generate_executive_summary()),
+                self._pdf_section("Technical Findings", heading_style, self._generate_technical_findings()),
+                self._pdf_section("Memory Analysis", heading_style, self._generate_memory_analysis()),
+            )
+            
+            # Error Analysis section removed per user request
+            
+            # Build PDF with custom footer
+            doc.build(FlowableStream(sections), onFirstPage=add_footer, onLaterPages=add_footer)
+            
+            self.logger.info(f"📄 Professional PDF report generated: {filename}")
+            return filename
+            
+        except Exception as e:
+            self.logger.error(f"Failed to generate PDF report: {e}")
+            return None
+
+    @cached_property
+    def _pdf_styles(self) -> Dict[str, 'ParagraphStyle']:
+        """Paragraph styles shared by every PDF section, built once per instance"""
+        from reportlab.lib.styles import ParagraphStyle
+        from reportlab.lib.enums import TA_CENTER
+        return {
             # Professional title style
-            title_style = ParagraphStyle(
+            'title': ParagraphStyle(
                 'ProfessionalTitle',
-                parent=styles['Heading1'],
+                parent=_sample_styles()['Heading1'],
                 fontSize=28,
                 spaceAfter=20,
                 alignment=TA_CENTER,
-                textColor=colors.HexColor('#1a365d'),  # Dark blue
+                textColor=_hex_color('#1a365d'),  # Dark blue
                 fontName='Helvetica-Bold'
-            )
-            
+            ),
             # Subtitle style
-            subtitle_style = ParagraphStyle(
+            'subtitle': ParagraphStyle(
                 'ProfessionalSubtitle',
-                parent=styles['Heading2'],
+                parent=_sample_styles()['Heading2'],
                 fontSize=18,
                 spaceAfter=15,
                 alignment=TA_CENTER,
-                textColor=colors.HexColor('#2d3748'),  # Dark gray
+                textColor=_hex_color('#2d3748'),  # Dark gray
                 fontName='Helvetica'
-            )
-            
+            ),
             # Section heading style - more compact and professional
-            heading_style = ParagraphStyle(
+            'heading': ParagraphStyle(
                 'ProfessionalHeading',
-                parent=styles['Heading2'],
+                parent=_sample_styles()['Heading2'],
                 fontSize=14,
                 spaceAfter=10,
                 spaceBefore=15,
-                textColor=colors.HexColor('#1a365d'),  # Dark blue
+                textColor=_hex_color('#1a365d'),  # Dark blue
                 fontName='Helvetica-Bold',
                 borderWidth=2,
-                borderColor=colors.HexColor('#2b6cb0'),
+                borderColor=_hex_color('#2b6cb0'),
                 borderPadding=6,
-                backColor=colors.HexColor('#ebf8ff'),
+                backColor=_hex_color('#ebf8ff'),
                 leftIndent=0,
                 rightIndent=0
-            )
-            
+            ),
             # Subheading style
-            subheading_style = ParagraphStyle(
+            'subheading': ParagraphStyle(
                 'ProfessionalSubheading',
-                parent=styles['Heading3'],
+                parent=_sample_styles()['Heading3'],
                 fontSize=14,
                 spaceAfter=10,
                 spaceBefore=15,
-                textColor=colors.HexColor('#4a5568'),  # Medium gray
+                textColor=_hex_color('#4a5568'),  # Medium gray
                 fontName='Helvetica-Bold'
-            )
-            
+            ),
             # Body text style
-            body_style = ParagraphStyle(
+            'body': ParagraphStyle(
                 'ProfessionalBody',
-                parent=styles['Normal'],
+                parent=_sample_styles()['Normal'],
                 fontSize=11,
                 spaceAfter=8,
-                textColor=colors.HexColor('#2d3748'),
+                textColor=_hex_color('#2d3748'),
                 fontName='Helvetica',
                 leading=14
-            )
-            
+            ),
             # Highlight style for key findings
-            highlight_style = ParagraphStyle(
+            'highlight': ParagraphStyle(
                 'ProfessionalHighlight',
-                parent=styles['Normal'],
+                parent=_sample_styles()['Normal'],
                 fontSize=11,
                 spaceAfter=8,
-                textColor=colors.HexColor('#1a365d'),
+                textColor=_hex_color('#1a365d'),
                 fontName='Helvetica-Bold',
-                backColor=colors.HexColor('#ebf8ff'),
+                backColor=_hex_color('#ebf8ff'),
                 borderWidth=1,
-                borderColor=colors.HexColor('#bee3f8'),
+                borderColor=_hex_color('#bee3f8'),
                 borderPadding=6
+            ),
+            # Italic notes below tables
+            'note': ParagraphStyle(
+                'NoteStyle',
+                parent=_sample_styles()['Normal'],
+                fontSize=9,
+                textColor=_hex_color('#718096'),
+                fontName='Helvetica-Oblique',
+                leftIndent=20
+            ),
+            'error_note': ParagraphStyle(
+                'ErrorNoteStyle',
+                parent=_sample_styles()['Normal'],
+                fontSize=9,
+                textColor=_hex_color('#718096'),
+                fontName='Helvetica-Oblique',
+                leftIndent=20
             )
-            
-            # Build the story (content)
-            story = []
-            
-            # Professional branded title page with logos
-            story.append(Spacer(1, 20))
-            
-            # Calculate full page width for tables
-            page_width = A4[0] - 100  # 50pt margins on each side
-            
-            # Header with centered BostonTec logo
-            try:
-                # Add centered BostonTec logo
-                bostontec_img = Image('BOSTONtec-Logo.png', width=150, height=50)
-                
-                # Create centered header
-                header_data = [[bostontec_img]]
-                header_table = Table(header_data, colWidths=[page_width])
-                header_table.setStyle(TableStyle([
-                    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-                    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-                    ('LEFTPADDING', (0, 0), (-1, -1), 0),
-                    ('RIGHTPADDING', (0, 0), (-1, -1), 0),
-                    ('TOPPADDING', (0, 0), (-1, -1), 0),
-                    ('BOTTOMPADDING', (0, 0), (-1, -1), 0),
-                ]))
-                story.append(header_table)
-                story.append(Spacer(1, 20))
-                
-            except Exception as e:
-                # Fallback if logo can't be loaded - log the error
-                self.logger.error(f"Failed to load BostonTec logo: {e}")
-                story.append(Paragraph("BostonTec", title_style))
-                story.append(Spacer(1, 10))
-            
-            # Main title with better styling
-            story.append(Paragraph("3D Workbench Builder", title_style))
-            story.append(Paragraph("Stress Test Analysis Report", subtitle_style))
-            story.append(Spacer(1, 20))
-            
-            # Compact metrics in a more professional layout
-            metrics_data = [
-                ['Test Information', 'Results', 'Performance'],
-                ['Date', datetime.now().strftime('%B %d, %Y'), 'Success Rate'],
-                ['Time', datetime.now().strftime('%I:%M %p'), f"{(self.stats['successful_runs'] / self.stats['total_runs']) * 100:.1f}%"],
-                ['Iterations', str(self.iterations), 'Avg Runtime'],
-                ['', '', f"{sum(self.stats['run_times']) / len(self.stats['run_times']):.1f}s" if self.stats['run_times'] else 'N/A']
-            ]
-            
-            # Calculate full page width (A4 width - margins)
-            page_width = A4[0] - 100  # 50pt margins on each side
-            metrics_table = Table(metrics_data, colWidths=[page_width/3, page_width/3, page_width/3])
-            metrics_table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#1a365d')),  # Dark blue header
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-                ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-                ('FONTSIZE', (0, 0), (-1, 0), 11),
-                ('FONTSIZE', (0, 1), (-1, -1), 10),
-                ('BOTTOMPADDING', (0, 0), (-1, 0), 10),
-                ('TOPPADDING', (0, 0), (-1, 0), 8),
-                ('BOTTOMPADDING', (0, 1), (-1, -1), 6),
-                ('TOPPADDING', (0, 1), (-1, -1), 6),
-                ('LEFTPADDING', (0, 0), (-1, -1), 8),
-                ('RIGHTPADDING', (0, 0), (-1, -1), 8),
-                ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor('#f7fafc')),
-                ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#e2e8f0')),
-                ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-            ]))
-            
-            story.append(metrics_table)
-            story.append(Spacer(1, 25))
-            story.append(PageBreak())
-            
-            # Executive Summary
-            story.append(Paragraph("Executive Summary", heading_style))
-            story.extend(self._generate_executive_summary())
-            story.append(PageBreak())
-            
-            # Technical Findings
-            story.append(Paragraph("Technical Findings", heading_style))
-            story.extend(self._generate_technical_findings())
-            story.append(PageBreak())
-            
-            # Memory Analysis
-            story.append(Paragraph("Memory Analysis", heading_style))
-            story.extend(self._generate_memory_analysis())
-            story.append(PageBreak())
-            
-            # Error Analysis section removed per user request
-            
-            # Build PDF with custom footer
-            doc.build(story, onFirstPage=add_footer, onLaterPages=add_footer)
-            
-            self.logger.info(f"📄 Professional PDF report generated: {filename}")
-            return filename
-            
-        except Exception as e:
-            self.logger.error(f"Failed to generate PDF report: {e}")
-            return None
+        }
+
+    def _pdf_section(self, title, heading_style, flowables):
+        """Yield a report section: heading, its content, then a page break"""
+        from reportlab.platypus import Paragraph, PageBreak
+        yield Paragraph(title, heading_style)
+        yield from flowables
+        yield PageBreak()
 
     def _generate_executive_summary(self):
         """Generate executive summary content"""
-        content = []
-        styles = getSampleStyleSheet()
-        
-        # Create professional styles
-        subheading_style = ParagraphStyle(
-            'ProfessionalSubheading',
-            parent=styles['Heading3'],
-            fontSize=14,
-            spaceAfter=10,
-            spaceBefore=15,
-            textColor=colors.HexColor('#4a5568'),
-            fontName='Helvetica-Bold'
-        )
-        
-        body_style = ParagraphStyle(
-            'ProfessionalBody',
-            parent=styles['Normal'],
-            fontSize=11,
-            spaceAfter=8,
-            textColor=colors.HexColor('#2d3748'),
-            fontName='Helvetica',
-            leading=14
-        )
-        
-        highlight_style = ParagraphStyle(
-            'ProfessionalHighlight',
-            parent=styles['Normal'],
-            fontSize=11,
-            spaceAfter=8,
-            textColor=colors.HexColor('#1a365d'),
-            fontName='Helvetica-Bold',
-            backColor=colors.HexColor('#ebf8ff'),
-            borderWidth=1,
-            borderColor=colors.HexColor('#bee3f8'),
-            borderPadding=6
-        )
+        from reportlab.platypus import Paragraph, Spacer, Table
+        styles = self._pdf_styles
+        subheading_style = styles['subheading']
+        body_style = styles['body']
         
         # Problem statement
-        content.append(Paragraph("Problem Statement", subheading_style))
-        content.append(Paragraph(
+        yield Paragraph("Problem Statement", subheading_style)
+        yield Paragraph(
             "Intermittent PDF export bug affecting the BostonTec 3D Workbench Builder configurator. "
             "Customers occasionally receive PDF attachments with missing images, impacting user experience and lead generation.",
             body_style
-        ))
-        content.append(Spacer(1, 10))
+        )
+        yield Spacer(1, 10)
         
         # Root cause
-        content.append(Paragraph("Root Cause Analysis", subheading_style))
-        content.append(Paragraph(
+        yield Paragraph("Root Cause Analysis", subheading_style)
+        yield Paragraph(
             "Memory pressure during JavaScript canvas-to-blob conversion for PDF generation. "
             "When browser memory usage exceeds certain thresholds, canvas rendering fails silently, "
             "resulting in incomplete PDFs with missing images.",
             body_style
-        ))
-        content.append(Spacer(1, 8))
+        )
+        yield Spacer(1, 8)
         
         # Testing limitations and scope
-        content.append(Paragraph("Testing Scope & Limitations", subheading_style))
-        content.append(Paragraph(
+        yield Paragraph("Testing Scope & Limitations", subheading_style)
+        yield Paragraph(
             "<b>What We Cannot Control:</b> Customer environments, device limitations, browser restrictions, "
             "network conditions, or unique hardware constraints that may affect PDF generation.",
             body_style
-        ))
-        content.append(Paragraph(
+        )
+        yield Paragraph(
             "<b>What We Can Control:</b> Application performance, memory usage patterns, error handling, "
             "and optimization opportunities within our configurator and PDF generation process.",
             body_style
-        ))
-        content.append(Paragraph(
+        )
+        yield Paragraph(
             "<b>Testing Strategy:</b> Focus on measurable, controllable factors that can help identify "
             "and mitigate PDF generation failures in production environments.",
             body_style
-        ))
-        content.append(Spacer(1, 10))
+        )
+        yield Spacer(1, 10)
         
         # Key findings
-        content.append(Paragraph("Key Findings", subheading_style))
+        yield Paragraph("Key Findings", subheading_style)
         
         # Get memory analysis
         memory_analysis = self._analyze_memory_patterns()
@@ -1146,222 +1812,121 @@ class BostonTecStressTest:
             # Create findings table
             findings_data = [
                 ['Metric', 'Value', 'Status'],
-                ['Peak Memory Usage', f"{peak_memory:.1f}%", 'LOW' if peak_memory < 60 else 'MEDIUM' if peak_memory < 80 else 'HIGH'],
-                ['Average Memory Usage', f"{avg_memory:.1f}%", 'LOW' if avg_memory < 60 else 'MEDIUM' if avg_memory < 80 else 'HIGH'],
+                ['Peak Memory Usage', f"{peak_memory:.1f}%", _memory_risk(peak_memory)],
+                ['Average Memory Usage', f"{avg_memory:.1f}%", _memory_risk(avg_memory)],
                 ['Memory Pressure Risk', risk_level, risk_level]
             ]
             
-            # Calculate full page width for tables
-            page_width = A4[0] - 100  # 50pt margins on each side
-            findings_table = Table(findings_data, colWidths=[page_width*0.5, page_width*0.3, page_width*0.2])
-            findings_table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#2b6cb0')),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-                ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-                ('FONTSIZE', (0, 0), (-1, 0), 12),
-                ('FONTSIZE', (0, 1), (-1, -1), 10),
-                ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-                ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor('#f7fafc')),
-                ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#e2e8f0')),
-                ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-            ]))
-            
-            content.append(findings_table)
-            content.append(Spacer(1, 10))
+            findings_table = Table(findings_data, colWidths=_col_widths(0.5, 0.3, 0.2))
+            findings_table.setStyle(_make_header_table_style('#2b6cb0', '#f7fafc', '#e2e8f0'))
+            
+            yield findings_table
+            yield Spacer(1, 10)
         
         # Error summary (excluding PDF generation logs for now)
-        error_logs = [log for log in self.stats['console_logs'] if log['level'] == 'error' and log.get('relevance') != 'pdf_generation']
-        zoovu_errors = [log for log in error_logs if log.get('relevance') == 'zoovu_error']
+        console_counts = self.stats['console_logs'].counts
+        error_logs = sum(count for (level, relevance), count in console_counts.items()
+                         if level == 'error' and relevance != 'pdf_generation')
+        zoovu_errors = console_counts['error', 'zoovu_error']
         
-        content.append(Paragraph("Error Summary", subheading_style))
+        yield Paragraph("Error Summary", subheading_style)
         error_summary_data = [
             ['Error Type', 'Count', 'Impact'],
-            ['Total JavaScript Errors', str(len(error_logs)), 'Medium'],
-            ['Zoovu Platform Errors', str(len(zoovu_errors)), 'High'],
-            ['Network Request Failures', str(len([req for req in self.stats['network_requests'] if req['event'] == 'failed'])), 'Low']
+            ['Total JavaScript Errors', str(error_logs), 'Medium'],
+            ['Zoovu Platform Errors', str(zoovu_errors), 'High'],
+            ['Network Request Failures', str(self.stats['network_requests'].count_event('failed')), 'Low']
         ]
         
-        error_table = Table(error_summary_data, colWidths=[page_width*0.5, page_width*0.2, page_width*0.3])
-        error_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#e53e3e')),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-            ('FONTSIZE', (0, 0), (-1, 0), 12),
-            ('FONTSIZE', (0, 1), (-1, -1), 10),
-            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-            ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor('#fef5e7')),
-            ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#fbd38d')),
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-        ]))
-        
-        content.append(error_table)
+        error_table = Table(error_summary_data, colWidths=_col_widths(0.5, 0.2, 0.3))
+        error_table.setStyle(_make_header_table_style('#e53e3e', '#fef5e7', '#fbd38d'))
         
-        return content
+        yield error_table
 
     def _generate_technical_findings(self):
         """Generate technical findings content"""
-        content = []
-        styles = getSampleStyleSheet()
-        
-        # Create professional styles
-        subheading_style = ParagraphStyle(
-            'ProfessionalSubheading',
-            parent=styles['Heading3'],
-            fontSize=14,
-            spaceAfter=10,
-            spaceBefore=15,
-            textColor=colors.HexColor('#4a5568'),
-            fontName='Helvetica-Bold'
-        )
+        from reportlab.platypus import Paragraph, Spacer, Table
+        styles = self._pdf_styles
+        subheading_style = styles['subheading']
         
         # Test execution summary
-        content.append(Paragraph("Test Execution Summary", subheading_style))
+        yield Paragraph("Test Execution Summary", subheading_style)
         
+        success_rate = self._success_rate()
+        avg_run_time = self._average_run_time()
         summary_data = [
             ['Metric', 'Value', 'Status'],
             ['Total Test Runs', str(self.stats['total_runs']), 'Complete'],
             ['Successful Runs', str(self.stats['successful_runs']), 'Passed'],
             ['Failed Runs', str(self.stats['failed_runs']), 'None' if self.stats['failed_runs'] == 0 else 'Issues Found'],
-            ['Success Rate', f"{(self.stats['successful_runs'] / self.stats['total_runs']) * 100:.1f}%", 'Excellent' if (self.stats['successful_runs'] / self.stats['total_runs']) * 100 >= 95 else 'Good'],
-            ['Average Run Time', f"{sum(self.stats['run_times']) / len(self.stats['run_times']):.1f}s" if self.stats['run_times'] else 'N/A', 'Normal']
+            ['Success Rate', f"{success_rate:.1f}%", 'Excellent' if success_rate >= 95 else 'Good'],
+            ['Average Run Time', f"{avg_run_time:.1f}s" if avg_run_time is not None else 'N/A', 'Normal']
         ]
         
-        # Calculate full page width for tables
-        page_width = A4[0] - 100  # 50pt margins on each side
-        summary_table = Table(summary_data, colWidths=[page_width*0.5, page_width*0.3, page_width*0.2])
-        summary_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#38a169')),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-            ('FONTSIZE', (0, 0), (-1, 0), 12),
-            ('FONTSIZE', (0, 1), (-1, -1), 10),
-            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-            ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor('#f0fff4')),
-            ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#9ae6b4')),
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-        ]))
+        summary_table = Table(summary_data, colWidths=_col_widths(0.5, 0.3, 0.2))
+        summary_table.setStyle(_make_header_table_style('#38a169', '#f0fff4', '#9ae6b4'))
         
-        content.append(summary_table)
+        yield summary_table
         
         # Add note about testing environment
-        content.append(Paragraph(
+        yield Paragraph(
             "<i>Note: Testing performed in controlled environment. Customer environments may vary significantly "
             "due to device limitations, browser restrictions, and network conditions beyond our control.</i>",
-            ParagraphStyle(
-                'NoteStyle',
-                parent=styles['Normal'],
-                fontSize=9,
-                textColor=colors.HexColor('#718096'),
-                fontName='Helvetica-Oblique',
-                leftIndent=20
-            )
-        ))
-        content.append(Spacer(1, 20))
+            styles['note']
+        )
+        yield Spacer(1, 20)
         
         # Logging statistics
-        content.append(Paragraph("Data Collection Statistics", subheading_style))
+        yield Paragraph("Data Collection Statistics", subheading_style)
         
         logging_data = [
             ['Data Type', 'Count', 'Filtering Applied'],
             ['Console Logs', str(len(self.stats['console_logs'])), 'Relevant errors only'],
             ['Network Requests', str(len(self.stats['network_requests'])), 'Zoovu-specific'],
             ['Performance Metrics', str(len(self.stats['performance_metrics'])), 'Memory & timing'],
-            ['Screenshots', str(self.stats['total_runs']), 'One per test run']
+            ['Screenshots', str(self.stats['total_runs']), 'One per test run'] if self.capture_screenshots
+            else ['Screenshots', '0', 'Disabled (--no-screenshots)']
         ]
         
-        logging_table = Table(logging_data, colWidths=[page_width*0.4, page_width*0.2, page_width*0.4])
-        logging_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#805ad5')),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-            ('FONTSIZE', (0, 0), (-1, 0), 12),
-            ('FONTSIZE', (0, 1), (-1, -1), 10),
-            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-            ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor('#faf5ff')),
-            ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#d6bcfa')),
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-        ]))
+        logging_table = Table(logging_data, colWidths=_col_widths(0.4, 0.2, 0.4))
+        logging_table.setStyle(_make_header_table_style('#805ad5', '#faf5ff', '#d6bcfa'))
         
-        content.append(logging_table)
-        
-        return content
+        yield logging_table
 
     def _generate_memory_analysis(self):
         """Generate memory analysis content with charts"""
-        content = []
-        styles = getSampleStyleSheet()
-        
-        # Create professional styles
-        subheading_style = ParagraphStyle(
-            'ProfessionalSubheading',
-            parent=styles['Heading3'],
-            fontSize=14,
-            spaceAfter=10,
-            spaceBefore=15,
-            textColor=colors.HexColor('#4a5568'),
-            fontName='Helvetica-Bold'
-        )
+        from reportlab.platypus import Paragraph, Spacer, Table
+        styles = self._pdf_styles
+        subheading_style = styles['subheading']
         
         memory_analysis = self._analyze_memory_patterns()
         if 'error' in memory_analysis:
-            content.append(Paragraph("Memory analysis data not available.", styles['Normal']))
-            return content
+            yield Paragraph("Memory analysis data not available.", _sample_styles()['Normal'])
+            return
         
         # Memory summary
-        content.append(Paragraph("Memory Usage Summary", subheading_style))
+        yield Paragraph("Memory Usage Summary", subheading_style)
         
         peak_memory = memory_analysis.get('peak_memory_usage', 0)
         avg_memory = memory_analysis.get('average_memory_usage', 0)
         risk_level = memory_analysis.get('pdf_bug_correlation', {}).get('memory_pressure_risk', 'UNKNOWN')
         
-        # Determine risk colors
-        def get_risk_color(risk):
-            if risk == 'LOW':
-                return colors.HexColor('#38a169')
-            elif risk == 'MEDIUM':
-                return colors.HexColor('#d69e2e')
-            else:
-                return colors.HexColor('#e53e3e')
-        
         memory_data = [
             ['Metric', 'Value', 'Risk Level'],
-            ['Peak Memory Usage', f"{peak_memory:.1f}%", 'LOW' if peak_memory < 60 else 'MEDIUM' if peak_memory < 80 else 'HIGH'],
-            ['Average Memory Usage', f"{avg_memory:.1f}%", 'LOW' if avg_memory < 60 else 'MEDIUM' if avg_memory < 80 else 'HIGH'],
+            ['Peak Memory Usage', f"{peak_memory:.1f}%", _memory_risk(peak_memory)],
+            ['Average Memory Usage', f"{avg_memory:.1f}%", _memory_risk(avg_memory)],
             ['Overall Risk Assessment', risk_level, risk_level]
         ]
         
-        # Calculate full page width for tables
-        page_width = A4[0] - 100  # 50pt margins on each side
-        memory_table = Table(memory_data, colWidths=[page_width*0.5, page_width*0.3, page_width*0.2])
-        memory_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#2b6cb0')),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-            ('FONTSIZE', (0, 0), (-1, 0), 12),
-            ('FONTSIZE', (0, 1), (-1, -1), 10),
-            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-            ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor('#ebf8ff')),
-            ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#bee3f8')),
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-        ]))
+        memory_table = Table(memory_data, colWidths=_col_widths(0.5, 0.3, 0.2))
+        memory_table.setStyle(_make_header_table_style('#2b6cb0', '#ebf8ff', '#bee3f8'))
         
-        content.append(memory_table)
-        content.append(Spacer(1, 20))
+        yield memory_table
+        yield Spacer(1, 20)
         
         # Memory pressure events
         pressure_events = memory_analysis.get('memory_pressure_events', {})
         if pressure_events:
-            content.append(Paragraph("Memory Pressure Events", subheading_style))
+            yield Paragraph("Memory Pressure Events", subheading_style)
             
             pressure_data = [
                 ['Event Type', 'Count', 'Severity'],
@@ -1370,166 +1935,89 @@ class BostonTecStressTest:
                 ['Critical Usage (90%+)', str(pressure_events.get('critical_usage_90_plus', 0)), 'Extreme']
             ]
             
-            pressure_table = Table(pressure_data, colWidths=[page_width*0.5, page_width*0.2, page_width*0.3])
-            pressure_table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#d69e2e')),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-                ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-                ('FONTSIZE', (0, 0), (-1, 0), 12),
-                ('FONTSIZE', (0, 1), (-1, -1), 10),
-                ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-                ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor('#fef5e7')),
-                ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#fbd38d')),
-                ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-            ]))
-            
-            content.append(pressure_table)
-        
-        return content
+            pressure_table = Table(pressure_data, colWidths=_col_widths(0.5, 0.2, 0.3))
+            pressure_table.setStyle(_make_header_table_style('#d69e2e', '#fef5e7', '#fbd38d'))
+            
+            yield pressure_table
 
     def _generate_error_analysis(self):
         """Generate error analysis content"""
-        content = []
-        styles = getSampleStyleSheet()
-        
-        # Create professional styles
-        subheading_style = ParagraphStyle(
-            'ProfessionalSubheading',
-            parent=styles['Heading3'],
-            fontSize=14,
-            spaceAfter=10,
-            spaceBefore=15,
-            textColor=colors.HexColor('#4a5568'),
-            fontName='Helvetica-Bold'
-        )
-        
-        body_style = ParagraphStyle(
-            'ProfessionalBody',
-            parent=styles['Normal'],
-            fontSize=10,
-            spaceAfter=6,
-            textColor=colors.HexColor('#2d3748'),
-            fontName='Helvetica',
-            leading=12
-        )
+        from reportlab.platypus import Paragraph, Spacer, Table
+        styles = self._pdf_styles
+        subheading_style = styles['subheading']
         
         # Console error breakdown
-        content.append(Paragraph("JavaScript Error Analysis", subheading_style))
+        yield Paragraph("JavaScript Error Analysis", subheading_style)
         
         # Count errors by relevance (excluding PDF generation logs for now)
-        relevance_counts = {}
-        for log in self.stats['console_logs']:
-            relevance = log.get('relevance', 'other')
+        error_data = [['Error Category', 'Count']]
+        _, relevance_counts = self.stats['console_logs'].tally()
+        for relevance, count in relevance_counts.most_common():
             # Skip PDF generation logs for now - they're mostly normal 3D rendering logs
             if relevance == 'pdf_generation':
                 continue
-            relevance_counts[relevance] = relevance_counts.get(relevance, 0) + 1
-        
-        error_data = [['Error Category', 'Count']]
-        for relevance, count in relevance_counts.items():
             error_data.append([relevance.replace('_', ' ').title(), str(count)])
         
-        # Calculate full page width for tables
-        page_width = A4[0] - 100  # 50pt margins on each side
-        error_table = Table(error_data, colWidths=[page_width*0.7, page_width*0.3])
-        error_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#e53e3e')),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-            ('FONTSIZE', (0, 0), (-1, 0), 12),
-            ('FONTSIZE', (0, 1), (-1, -1), 10),
-            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-            ('BACKGROUND', (0, 1), (-1, -1), colors.HexColor('#fef5e7')),
-            ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#fbd38d')),
-            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-            ]))
+        error_table = Table(error_data, colWidths=_col_widths(0.7, 0.3))
+        error_table.setStyle(_make_header_table_style('#e53e3e', '#fef5e7', '#fbd38d'))
             
-        content.append(error_table)
+        yield error_table
         
         # Add explanation about errors not impacting experience
-        content.append(Paragraph(
+        yield Paragraph(
             "<i>Note: These JavaScript errors are primarily related to component lifecycle events and lazy loading "
             "optimizations. They do not impact the user experience or core functionality of the configurator. "
             "The application continues to function normally despite these console messages.</i>",
-            ParagraphStyle(
-                'ErrorNoteStyle',
-                parent=styles['Normal'],
-                fontSize=9,
-                textColor=colors.HexColor('#718096'),
-                fontName='Helvetica-Oblique',
-                leftIndent=20
-            )
-        ))
-        content.append(Spacer(1, 15))
+            styles['error_note']
+        )
+        yield Spacer(1, 15)
         
         # Key error examples
-        content.append(Paragraph("JavaScript Error Examples", subheading_style))
+        yield Paragraph("JavaScript Error Examples", subheading_style)
         
-        # Get top Zoovu errors
-        zoovu_errors = [log for log in self.stats['console_logs'] if log.get('relevance') == 'zoovu_error' and log['level'] == 'error']
+        # Top Zoovu errors, kept by the console buffer as they were captured
+        zoovu_errors = self.stats['console_logs'].zoovu_error_examples
         
         if zoovu_errors:
-            for i, error in enumerate(zoovu_errors[:2]):  # Show top 2 errors
-                error_text = error['text'][:150] + "..." if len(error['text']) > 150 else error['text']
-                
-                # Create error box
-                error_box_data = [
-                    [f"Error {i+1}: {error_text}"]
-                ]
-                
-                error_box = Table(error_box_data, colWidths=[page_width])
-                error_box.setStyle(TableStyle([
-                    ('BACKGROUND', (0, 0), (-1, -1), colors.HexColor('#fed7d7')),
-                    ('TEXTCOLOR', (0, 0), (-1, -1), colors.HexColor('#742a2a')),
-                    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-                    ('FONTNAME', (0, 0), (-1, -1), 'Helvetica'),
-                    ('FONTSIZE', (0, 0), (-1, -1), 9),
-                    ('BOTTOMPADDING', (0, 0), (-1, -1), 8),
-                    ('TOPPADDING', (0, 0), (-1, -1), 8),
-                    ('LEFTPADDING', (0, 0), (-1, -1), 10),
-                    ('RIGHTPADDING', (0, 0), (-1, -1), 10),
-                    ('GRID', (0, 0), (-1, -1), 1, colors.HexColor('#feb2b2')),
-                    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-                ]))
-                
-                content.append(error_box)
-                content.append(Spacer(1, 10))
-        
-        return content
+            # One error box table with a row per error (at most 2, bounded by ConsoleBuffer)
+            error_box_data = [
+                [f"Error {i+1}: {(error[:150] + '...') if len(error) > 150 else error}"]
+                for i, error in enumerate(zoovu_errors)
+            ]
+            
+            error_box = Table(error_box_data, colWidths=_col_widths(1))
+            error_box.setStyle(_fixed_table_styles()['error_box'])
+            
+            yield error_box
+            yield Spacer(1, 10)
 
     def _generate_recommendations(self):
         """Generate actionable recommendations"""
-        content = []
-        styles = getSampleStyleSheet()
-        
-        content.append(Paragraph("<b>Immediate Actions (Next 1-2 weeks):</b>", styles['Heading3']))
-        content.append(Paragraph("1. Add comprehensive logging to the canvas-to-blob conversion process", styles['Normal']))
-        content.append(Paragraph("2. Implement memory pressure detection before PDF generation", styles['Normal']))
-        content.append(Paragraph("3. Add error handling for canvas rendering failures", styles['Normal']))
-        content.append(Spacer(1, 12))
-        
-        content.append(Paragraph("<b>Short-term Improvements (Next 1-2 months):</b>", styles['Heading3']))
-        content.append(Paragraph("1. Implement memory cleanup strategies between configurator operations", styles['Normal']))
-        content.append(Paragraph("2. Add retry mechanisms for failed PDF generation", styles['Normal']))
-        content.append(Paragraph("3. Optimize canvas rendering performance to reduce memory usage", styles['Normal']))
-        content.append(Spacer(1, 12))
-        
-        content.append(Paragraph("<b>Long-term Solutions (Next 3-6 months):</b>", styles['Heading3']))
-        content.append(Paragraph("1. Implement server-side PDF generation as fallback", styles['Normal']))
-        content.append(Paragraph("2. Add real-time monitoring dashboard for production", styles['Normal']))
-        content.append(Paragraph("3. Optimize overall memory usage in the configurator application", styles['Normal']))
-        content.append(Spacer(1, 12))
-        
-        content.append(Paragraph("<b>Success Metrics:</b>", styles['Heading3']))
-        content.append(Paragraph("• Reduce PDF generation failures by 90%", styles['Normal']))
-        content.append(Paragraph("• Achieve <5% memory usage during normal operations", styles['Normal']))
-        content.append(Paragraph("• Implement 100% error logging coverage for PDF generation", styles['Normal']))
-        
-        return content
+        from reportlab.platypus import Paragraph, Spacer
+        styles = _sample_styles()
+        
+        yield Paragraph("<b>Immediate Actions (Next 1-2 weeks):</b>", styles['Heading3'])
+        yield Paragraph("1. Add comprehensive logging to the canvas-to-blob conversion process", styles['Normal'])
+        yield Paragraph("2. Implement memory pressure detection before PDF generation", styles['Normal'])
+        yield Paragraph("3. Add error handling for canvas rendering failures", styles['Normal'])
+        yield Spacer(1, 12)
+        
+        yield Paragraph("<b>Short-term Improvements (Next 1-2 months):</b>", styles['Heading3'])
+        yield Paragraph("1. Implement memory cleanup strategies between configurator operations", styles['Normal'])
+        yield Paragraph("2. Add retry mechanisms for failed PDF generation", styles['Normal'])
+        yield Paragraph("3. Optimize canvas rendering performance to reduce memory usage", styles['Normal'])
+        yield Spacer(1, 12)
+        
+        yield Paragraph("<b>Long-term Solutions (Next 3-6 months):</b>", styles['Heading3'])
+        yield Paragraph("1. Implement server-side PDF generation as fallback", styles['Normal'])
+        yield Paragraph("2. Add real-time monitoring dashboard for production", styles['Normal'])
+        yield Paragraph("3. Optimize overall memory usage in the configurator application", styles['Normal'])
+        yield Spacer(1, 12)
+        
+        yield Paragraph("<b>Success Metrics:</b>", styles['Heading3'])
+        yield Paragraph("• Reduce PDF generation failures by 90%", styles['Normal'])
+        yield Paragraph("• Achieve <5% memory usage during normal operations", styles['Normal'])
+        yield Paragraph("• Implement 100% error logging coverage for PDF generation", styles['Normal'])
 
 
 def main():
@@ -1548,17 +2036,33 @@ def main():
                        help='Generate modern HTML report with Tailwind CSS')
     parser.add_argument('--deploy-reports', action='store_true',
                        help='Deploy HTML reports to GitHub Pages after generation')
+    parser.add_argument('--debug-elements', action='store_true',
+                       help='Capture and log element state before and after each click')
+    parser.add_argument('--interactive', action=argparse.BooleanOptionalAction, default=True,
+                       help='Wait for Enter before closing the browser (always off with --headless)')
+    parser.add_argument('--inspect-seconds', type=int, default=0,
+                       help='Keep the browser open for N seconds after the last run instead of waiting for Enter')
+    parser.add_argument('--workers', '-w', type=int, default=1,
+                       help='Number of browsers running iterations concurrently (default: 1)')
+    parser.add_argument('--no-screenshots', action='store_true',
+                       help='Skip the final-state screenshot after each run')
+    parser.add_argument('--capture-all-network', action='store_true',
+                       help='Also capture font, stylesheet and media requests (skipped by default)')
+    parser.add_argument('--cdp-endpoint', type=str, default=None,
+                       help='Attach to a running Chromium over CDP (e.g. http://localhost:9222) instead of launching one; '
+                            'start it with --js-flags=--expose-gc to keep forced garbage collection')
     
     args = parser.parse_args()
     
     if args.verbose:
         logging.getLogger().setLevel(logging.DEBUG)
     
-    # Validate test path file exists
-    if not Path(args.test_path).exists():
+    # Validate test path file exists (a single stat; the constructor opens it by name)
+    if not os.path.isfile(args.test_path):
         print(f"Error: Test path file '{args.test_path}' not found")
         return 1
     
+    stress_test = None
     try:
         print("🚀 BostonTec Configurator Stress Test")
         print("=" * 50)
@@ -1570,21 +2074,32 @@ def main():
         stress_test = BostonTecStressTest(
             test_path_file=args.test_path,
             iterations=args.iterations,
-            headless=args.headless
+            headless=args.headless,
+            generate_pdf=args.pdf_report
         )
         
         # Set report flags
-        stress_test.generate_pdf = args.pdf_report
         stress_test.generate_html = args.html_report
         stress_test.deploy_reports = args.deploy_reports
+        stress_test.debug_elements = args.debug_elements
+        stress_test.interactive = args.interactive and not args.headless
+        stress_test.inspect_seconds = args.inspect_seconds
+        stress_test.workers = max(1, args.workers)
+        stress_test.cdp_endpoint = args.cdp_endpoint
+        stress_test.capture_screenshots = not args.no_screenshots
+        if args.capture_all_network:
+            stress_test.ignored_resource_types = frozenset()
         
         stress_test.run_stress_test()
         return 0
         
-    except Exception as e:
-        print(f"Error running stress test: {e}")
+    except (PlaywrightError, RuntimeError, OSError, ValueError):
+        logging.exception("Error running stress test")
         return 1
+    finally:
+        if stress_test is not None:
+            stress_test.shutdown_logging()
 
 
 if __name__ == "__main__":
-    exit(main())
+    raise SystemExit(main())
@@ -7,6 +7,7 @@ Moves old reports and data files to organized archive folders
 import os
 import shutil
 import glob
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 def create_archive_structure():
@@ -22,63 +23,49 @@ def create_archive_structure():
         os.makedirs(dir_path, exist_ok=True)
         print(f"✅ Created directory: {dir_path}")
 
-def cleanup_test_data_files():
-    """Move old test data JSON files to archive"""
-    test_data_files = glob.glob('bostontec_stress_test_data_*.json')
-    
-    if test_data_files:
-        print(f"\n📊 Found {len(test_data_files)} old test data files:")
-        for file in test_data_files:
-            print(f"  - {file}")
-            shutil.move(file, f'archive/old_test_data/{file}')
-        print(f"✅ Moved {len(test_data_files)} test data files to archive/old_test_data/")
-    else:
-        print("📊 No old test data files found")
+# Archive rules: (category, emoji, name prefix, name suffixes, destination)
+ARCHIVE_RULES = [
+    ('test data', '📊', 'bostontec_stress_test_data_', ('.json',), 'archive/old_test_data'),
+    ('report', '📄', 'bostontec_stress_test_report_', ('.html',), 'archive/old_reports'),
+    ('mock data', '🎭', 'mock_memory_test_data_', ('.json',), 'archive/old_mock_data'),
+    ('debug/temp', '🐛', 'run_', ('_final_state.png', '_final_state.jpg', '_export.pdf'), 'archive/debug_files'),
+    ('debug/temp', '🐛', '', ('.log',), 'archive/debug_files'),
+]
 
-def cleanup_report_files():
-    """Move old HTML report files from root to archive"""
-    report_files = glob.glob('bostontec_stress_test_report_*.html')
-    
-    if report_files:
-        print(f"\n📄 Found {len(report_files)} old report files in root:")
-        for file in report_files:
-            print(f"  - {file}")
-            shutil.move(file, f'archive/old_reports/{file}')
-        print(f"✅ Moved {len(report_files)} report files to archive/old_reports/")
-    else:
-        print("📄 No old report files found in root")
+def scan_archivable_files():
+    """Sort the files in the current directory into archive destinations in one directory read"""
+    matches = {}
+    with os.scandir('.') as entries:
+        for entry in entries:
+            if entry.name.startswith('.') or not entry.is_file():
+                continue
+            for category, emoji, prefix, suffixes, destination in ARCHIVE_RULES:
+                if entry.name.startswith(prefix) and entry.name.endswith(suffixes):
+                    matches.setdefault((category, emoji, destination), []).append(entry.name)
+                    break
+    return matches
 
-def cleanup_mock_data_files():
-    """Move old mock data files to archive"""
-    mock_data_files = glob.glob('mock_memory_test_data_*.json')
-    
-    if mock_data_files:
-        print(f"\n🎭 Found {len(mock_data_files)} old mock data files:")
-        for file in mock_data_files:
-            print(f"  - {file}")
-            shutil.move(file, f'archive/old_mock_data/{file}')
-        print(f"✅ Moved {len(mock_data_files)} mock data files to archive/old_mock_data/")
-    else:
-        print("🎭 No old mock data files found")
-
-def cleanup_debug_files():
-    """Move debug and temporary files to archive"""
-    debug_files = []
-    
-    # Add debug images
-    debug_files.extend(glob.glob('run_*_final_state.png'))
-    
-    # Add log files
-    debug_files.extend(glob.glob('*.log'))
-    
-    if debug_files:
-        print(f"\n🐛 Found {len(debug_files)} debug/temp files:")
-        for file in debug_files:
-            print(f"  - {file}")
-            shutil.move(file, f'archive/debug_files/{file}')
-        print(f"✅ Moved {len(debug_files)} debug files to archive/debug_files/")
-    else:
-        print("🐛 No debug files found")
+def archive_files():
+    """Move old test data, reports, mock data and debug files to their archive folders"""
+    matches = scan_archivable_files()
+    
+    # Moves are independent renames; run them concurrently
+    moves = []
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        for category, emoji, destination in dict.fromkeys((c, e, d) for c, e, _, _, d in ARCHIVE_RULES):
+            files = sorted(matches.get((category, emoji, destination), []))
+            if files:
+                print(f"\n{emoji} Found {len(files)} old {category} files:")
+                for file in files:
+                    print(f"  - {file}")
+                    moves.append(pool.submit(shutil.move, file, f'{destination}/{file}'))
+                print(f"✅ Moving {len(files)} {category} files to {destination}/")
+            else:
+                print(f"{emoji} No old {category} files found")
+    
+    # Surface any failed move
+    for move in moves:
+        move.result()
 
 def cleanup_duplicate_reports():
     """Remove duplicate reports folder since we have html_reports/"""
@@ -91,14 +78,17 @@ def cleanup_duplicate_reports():
 
 def cleanup_cache():
     """Remove Python cache files"""
-    cache_dirs = glob.glob('__pycache__')
-    cache_dirs.extend(glob.glob('**/__pycache__', recursive=True))
+    # The recursive pattern already matches the top-level __pycache__
+    cache_dirs = glob.glob('**/__pycache__', recursive=True)
     
     if cache_dirs:
         print(f"\n🗑️  Found {len(cache_dirs)} cache directories:")
         for cache_dir in cache_dirs:
             print(f"  - {cache_dir}")
-            shutil.rmtree(cache_dir)
+        
+        # Tree removals are independent; run them concurrently
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(shutil.rmtree, cache_dirs))
         print(f"✅ Removed {len(cache_dirs)} cache directories")
     else:
         print("🗑️  No cache directories found")
@@ -108,9 +98,14 @@ def show_cleanup_summary():
     print(f"\n📋 CLEANUP SUMMARY")
     print(f"=" * 50)
     
-    # List remaining files in main directory
-    remaining_files = [f for f in os.listdir('.') if os.path.isfile(f)]
-    remaining_dirs = [d for d in os.listdir('.') if os.path.isdir(d) and not d.startswith('.')]
+    # List remaining files and directories in one directory read
+    remaining_files, remaining_dirs = [], []
+    with os.scandir('.') as entries:
+        for entry in entries:
+            if entry.is_file():
+                remaining_files.append(entry.name)
+            elif entry.is_dir() and not entry.name.startswith('.'):
+                remaining_dirs.append(entry.name)
     
     print(f"\n📁 Remaining directories:")
     for dir_name in sorted(remaining_dirs):
@@ -132,10 +127,7 @@ def main():
     create_archive_structure()
     
     # Clean up different file types
-    cleanup_test_data_files()
-    cleanup_report_files() 
-    cleanup_mock_data_files()
-    cleanup_debug_files()
+    archive_files()
     cleanup_duplicate_reports()
     cleanup_cache()
     